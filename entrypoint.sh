@@ -201,7 +201,7 @@ check_requirements() {
     python3 -c "
 import requests
 import psycopg2
-import schedule
+import numpy
 print('Required Python packages are available')
 " || {
         log_message "ERROR" "Required Python packages are missing"
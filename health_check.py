@@ -6,6 +6,9 @@ This script performs comprehensive health checks for the containerized
 Rdio Scanner Monitor application, including database connectivity,
 API responsiveness, and system resource checks.
 
+Set HEALTH_OUTPUT_FORMAT to 'json' (default), 'text', or 'none' to skip
+output entirely and report status through the exit code only.
+
 Exit codes:
     0 - All health checks passed
     1 - Critical health check failed
@@ -16,20 +19,135 @@ import sys
 import os
 import time
 import json
+import re
 import socket
+import http.client
 import subprocess
+import threading
+import functools
+from concurrent.futures import Future, as_completed, TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 import logging
+import shutil
+
+# Optional dependencies are imported once at module load rather than on every
+# probe; a missing module is reported by the check that needs it
+try:
+    import psycopg2
+    from psycopg2.pool import ThreadedConnectionPool
+except ImportError:
+    psycopg2 = None
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+try:
+    import resource
+except ImportError:
+    resource = None  # Not available on Windows
+
+# Prefer orjson for encoding/decoding health check JSON, falling back to the
+# standard library when it isn't installed
+try:
+    import orjson
+    
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+    
+    _loads = json.loads
 
-# Configure logging for health check script
+# Memory fields of interest in /proc/self/status, matched in a single pass
+_STATUS_RE = re.compile(rb'^(Vm(?:RSS|Size)):\s+(\d+)', re.MULTILINE)
+_STATUS_KEYS = {b'VmRSS': 'rss_kb', b'VmSize': 'size_kb'}
+
+# Configure logging for health check script; probes run constantly, so only
+# warnings and errors are logged unless HEALTH_LOG_LEVEL says otherwise
 logging.basicConfig(
-    level=logging.INFO,
+    level=getattr(logging, os.getenv('HEALTH_LOG_LEVEL', 'WARNING').upper(), logging.WARNING),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 logger = logging.getLogger('health_check')
 
+
+@dataclass(slots=True, frozen=True)
+class HCConfig:
+    """Health checker settings, read once from environment variables."""
+    database_host: str
+    database_port: int
+    database_name: str
+    database_user: str
+    database_password: str
+    redis_host: str
+    redis_port: int
+    api_port: int
+    health_timeout: int
+
+
+@functools.cache
+def _load_config() -> HCConfig:
+    """
+    Build the health checker configuration from environment variables.
+    
+    Parsed once per process and shared by every HealthChecker instance.
+    
+    Returns:
+        HCConfig: Health checker settings
+    """
+    return HCConfig(
+        database_host=os.getenv('DATABASE_HOST', 'localhost'),
+        database_port=int(os.getenv('DATABASE_PORT', '5432')),
+        database_name=os.getenv('DATABASE_NAME', 'rdio_scanner'),
+        database_user=os.getenv('DATABASE_USER', 'scanner'),
+        database_password=os.getenv('DATABASE_PASSWORD', 'scanner_password'),
+        redis_host=os.getenv('REDIS_HOST', 'localhost'),
+        redis_port=int(os.getenv('REDIS_PORT', '6379')),
+        api_port=int(os.getenv('API_PORT', '8080')),
+        health_timeout=int(os.getenv('HEALTH_TIMEOUT', '10')),
+    )
+
+
+def _submit_daemon(fn, *args) -> Future:
+    """
+    Run a call on its own daemon thread and return a future for its result.
+    
+    Unlike ThreadPoolExecutor workers, daemon threads don't keep the process
+    alive at exit, so a call stuck past the probe deadline (a hung check or a
+    statvfs on a stuck mount) can't delay the exit code that HEALTHCHECK and
+    supervisord wait for.
+    
+    Args:
+        fn: Callable to run
+        *args: Positional arguments for fn
+        
+    Returns:
+        Future: Completed with fn's return value or exception
+    """
+    future = Future()
+    
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
 class HealthChecker:
     """
     Comprehensive health checking system for the Rdio Scanner Monitor.
@@ -38,6 +156,18 @@ class HealthChecker:
     API responsiveness, system resources, and application-specific metrics.
     """
     
+    # Database connection pool shared across checker instances so repeated
+    # probes in the same process skip the connect/auth handshake
+    _pool = None
+    _pool_lock = threading.Lock()
+    
+    # Redis client with a small keep-alive connection pool, shared the same way
+    _redis = None
+    
+    # Keep-alive HTTP connection to the local API, shared the same way
+    _api_conn = None
+    _api_lock = threading.Lock()
+    
     def __init__(self):
         """Initialize the health checker with configuration."""
         self.start_time = time.time()
@@ -45,19 +175,22 @@ class HealthChecker:
         self.checks_failed = 0
         self.checks_warning = 0
         self.results = []
+        # With HEALTH_OUTPUT_FORMAT=none only the exit code matters, so just
+        # keep the counters
+        self.keep_results = os.getenv('HEALTH_OUTPUT_FORMAT', 'json').lower() != 'none'
+        self._results_lock = threading.Lock()
+        # Set once the probe deadline has passed; results from checks that
+        # finish later are dropped instead of changing a finished summary
+        self._sealed = False
+        # Timestamp shared by every result of the current probe run
+        self._probe_ts = None
+        # Per-probe caches of stat()/access() results for paths that several
+        # checks look at
+        self._stat_cache: Dict[str, Optional[os.stat_result]] = {}
+        self._access_cache: Dict[str, bool] = {}
         
         # Configuration from environment variables
-        self.config = {
-            'database_host': os.getenv('DATABASE_HOST', 'localhost'),
-            'database_port': int(os.getenv('DATABASE_PORT', '5432')),
-            'database_name': os.getenv('DATABASE_NAME', 'rdio_scanner'),
-            'database_user': os.getenv('DATABASE_USER', 'scanner'),
-            'database_password': os.getenv('DATABASE_PASSWORD', 'scanner_password'),
-            'redis_host': os.getenv('REDIS_HOST', 'localhost'),
-            'redis_port': int(os.getenv('REDIS_PORT', '6379')),
-            'api_port': int(os.getenv('API_PORT', '8080')),
-            'health_timeout': int(os.getenv('HEALTH_TIMEOUT', '10')),
-        }
+        self.config = _load_config()
         
         logger.info("Health checker initialized")
     
@@ -77,23 +210,103 @@ class HealthChecker:
             'check': check_name,
             'status': status,
             'message': message,
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': self._probe_ts or datetime.now(timezone.utc).isoformat(),
             'duration_seconds': duration,
             'details': details or {}
         }
         
-        self.results.append(result)
+        # Checks run concurrently, so guard the shared results and counters
+        with self._results_lock:
+            if self._sealed:
+                return
+            if self.keep_results:
+                self.results.append(result)
+            
+            # Update counters
+            if status == 'pass':
+                self.checks_passed += 1
+            elif status == 'fail':
+                self.checks_failed += 1
+            elif status == 'warning':
+                self.checks_warning += 1
         
-        # Update counters
         if status == 'pass':
-            self.checks_passed += 1
-            logger.info(f"✓ {check_name}: {message}")
+            logger.info("✓ %s: %s", check_name, message)
         elif status == 'fail':
-            self.checks_failed += 1
-            logger.error(f"✗ {check_name}: {message}")
+            logger.error("✗ %s: %s", check_name, message)
         elif status == 'warning':
-            self.checks_warning += 1
-            logger.warning(f"⚠ {check_name}: {message}")
+            logger.warning("⚠ %s: %s", check_name, message)
+    
+    def _stat(self, path: str) -> Optional[os.stat_result]:
+        """
+        Stat a path at most once per probe run.
+        
+        Args:
+            path: Filesystem path to stat
+            
+        Returns:
+            Optional[os.stat_result]: Stat result, None if the path doesn't exist
+        """
+        if path not in self._stat_cache:
+            try:
+                self._stat_cache[path] = os.stat(path)
+            except OSError:
+                self._stat_cache[path] = None
+        return self._stat_cache[path]
+    
+    def _path_exists(self, path: str) -> bool:
+        """Check whether a path exists using the per-probe stat cache."""
+        return self._stat(path) is not None
+    
+    def _is_writable(self, path: str) -> bool:
+        """Check whether an existing path is writable, at most once per probe run."""
+        if path not in self._access_cache:
+            self._access_cache[path] = self._path_exists(path) and os.access(path, os.W_OK)
+        return self._access_cache[path]
+    
+    def _get_db_pool(self):
+        """
+        Get the shared database connection pool, creating it on first use.
+        
+        Returns:
+            ThreadedConnectionPool: Pool of database connections
+        """
+        with HealthChecker._pool_lock:
+            if HealthChecker._pool is None:
+                HealthChecker._pool = ThreadedConnectionPool(
+                    minconn=1,
+                    maxconn=2,
+                    host=self.config.database_host,
+                    port=self.config.database_port,
+                    database=self.config.database_name,
+                    user=self.config.database_user,
+                    password=self.config.database_password,
+                    connect_timeout=self.config.health_timeout
+                )
+            return HealthChecker._pool
+    
+    def _query_db_status(self, conn) -> Tuple[str, int, int]:
+        """
+        Fetch the server version, application table count and recent call
+        count in a single round trip.
+        
+        Args:
+            conn: Database connection to query
+            
+        Returns:
+            Tuple[str, int, int]: Version string, table count, calls in the last hour
+        """
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT
+                    version(),
+                    (SELECT count(*) FROM information_schema.tables
+                     WHERE table_name IN ('calls', 'audio_files', 'system_stats')),
+                    (SELECT COUNT(*) FROM calls
+                     WHERE created_at > NOW() - INTERVAL '1 hour')
+            """)
+            return cursor.fetchone()
     
     def check_database_connectivity(self) -> bool:
         """
@@ -104,58 +317,7 @@ class HealthChecker:
         """
         start_time = time.time()
         
-        try:
-            import psycopg2
-            from psycopg2 import sql
-            
-            # Create connection string
-            connection_params = {
-                'host': self.config['database_host'],
-                'port': self.config['database_port'],
-                'database': self.config['database_name'],
-                'user': self.config['database_user'],
-                'password': self.config['database_password'],
-                'connect_timeout': self.config['health_timeout']
-            }
-            
-            # Test connection
-            with psycopg2.connect(**connection_params) as conn:
-                with conn.cursor() as cursor:
-                    # Test basic query
-                    cursor.execute("SELECT version();")
-                    version = cursor.fetchone()[0]
-                    
-                    # Test application tables exist
-                    cursor.execute("""
-                        SELECT count(*) FROM information_schema.tables 
-                        WHERE table_name IN ('calls', 'audio_files', 'system_stats')
-                    """)
-                    table_count = cursor.fetchone()[0]
-                    
-                    # Test recent data activity
-                    cursor.execute("""
-                        SELECT COUNT(*) FROM calls 
-                        WHERE created_at > NOW() - INTERVAL '1 hour'
-                    """)
-                    recent_calls = cursor.fetchone()[0]
-                    
-                    duration = time.time() - start_time
-                    
-                    self.add_result(
-                        'database_connectivity',
-                        'pass',
-                        'Database connection and queries successful',
-                        {
-                            'postgres_version': version,
-                            'application_tables': table_count,
-                            'recent_calls_count': recent_calls,
-                            'response_time_ms': round(duration * 1000, 2)
-                        },
-                        duration
-                    )
-                    return True
-                    
-        except ImportError:
+        if psycopg2 is None:
             self.add_result(
                 'database_connectivity',
                 'fail',
@@ -164,7 +326,39 @@ class HealthChecker:
                 time.time() - start_time
             )
             return False
+        
+        try:
+            # Test connection, basic query, application tables and recent
+            # data activity; no separate liveness ping, since a stale pooled
+            # connection simply fails the query and is replaced once
+            pool = self._get_db_pool()
+            conn = pool.getconn()
+            try:
+                try:
+                    version, table_count, recent_calls = self._query_db_status(conn)
+                except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                    pool.putconn(conn, close=True)
+                    conn = pool.getconn()
+                    version, table_count, recent_calls = self._query_db_status(conn)
+            finally:
+                pool.putconn(conn, close=bool(conn.closed))
+            
+            duration = time.time() - start_time
             
+            self.add_result(
+                'database_connectivity',
+                'pass',
+                'Database connection and queries successful',
+                {
+                    'postgres_version': version,
+                    'application_tables': table_count,
+                    'recent_calls_count': recent_calls,
+                    'response_time_ms': round(duration * 1000, 2)
+                },
+                duration
+            )
+            return True
+                    
         except Exception as e:
             duration = time.time() - start_time
             self.add_result(
@@ -176,6 +370,35 @@ class HealthChecker:
             )
             return False
     
+    def _get_redis_client(self, redis_url: Optional[str]):
+        """
+        Get the shared Redis client, creating it on first use.
+        
+        Args:
+            redis_url: Redis connection URL, if configured
+            
+        Returns:
+            redis.Redis: Client backed by a blocking connection pool
+        """
+        with HealthChecker._pool_lock:
+            if HealthChecker._redis is None:
+                pool_options = {
+                    'max_connections': 2,
+                    'socket_timeout': self.config.health_timeout,
+                    'socket_connect_timeout': self.config.health_timeout,
+                    'socket_keepalive': True,
+                }
+                if redis_url:
+                    connection_pool = redis.BlockingConnectionPool.from_url(redis_url, **pool_options)
+                else:
+                    connection_pool = redis.BlockingConnectionPool(
+                        host=self.config.redis_host,
+                        port=self.config.redis_port,
+                        **pool_options
+                    )
+                HealthChecker._redis = redis.Redis(connection_pool=connection_pool)
+            return HealthChecker._redis
+    
     def check_redis_connectivity(self) -> bool:
         """
         Test Redis connectivity if Redis is configured.
@@ -184,7 +407,7 @@ class HealthChecker:
             bool: True if Redis is healthy or not configured, False if configured but failing
         """
         redis_url = os.getenv('REDIS_URL')
-        if not redis_url and self.config['redis_host'] == 'localhost':
+        if not redis_url and self.config.redis_host == 'localhost':
             self.add_result(
                 'redis_connectivity',
                 'pass',
@@ -196,10 +419,23 @@ class HealthChecker:
         start_time = time.time()
         
         try:
-            # Test TCP connection to Redis
+            if redis is not None:
+                # PING over a pooled connection validates that Redis is serving
+                self._get_redis_client(redis_url).ping()
+                duration = time.time() - start_time
+                self.add_result(
+                    'redis_connectivity',
+                    'pass',
+                    'Redis PING successful',
+                    {'response_time_ms': round(duration * 1000, 2)},
+                    duration
+                )
+                return True
+            
+            # redis module not available - fall back to a TCP connection test
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.config['health_timeout'])
-            result = sock.connect_ex((self.config['redis_host'], self.config['redis_port']))
+            sock.settimeout(self.config.health_timeout)
+            result = sock.connect_ex((self.config.redis_host, self.config.redis_port))
             sock.close()
             
             duration = time.time() - start_time
@@ -234,6 +470,42 @@ class HealthChecker:
             )
             return False
     
+    def _api_get(self, path: str) -> Tuple[int, bytes]:
+        """
+        Issue a GET against the local API over a reused keep-alive connection.
+        
+        Args:
+            path: Request path on the local API
+            
+        Returns:
+            Tuple[int, bytes]: Response status code and body
+        """
+        with HealthChecker._api_lock:
+            reused = HealthChecker._api_conn is not None
+            if not reused:
+                HealthChecker._api_conn = http.client.HTTPConnection(
+                    'localhost', self.config.api_port, timeout=self.config.health_timeout
+                )
+            conn = HealthChecker._api_conn
+            
+            while True:
+                try:
+                    conn.request('GET', path, headers={'User-Agent': 'HealthCheck/1.0'})
+                    response = conn.getresponse()
+                    return response.status, response.read()
+                except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                    conn.close()
+                    if not reused:
+                        HealthChecker._api_conn = None
+                        raise
+                    # Server dropped the idle keep-alive connection; retry
+                    # once, treating the reopened connection as fresh
+                    reused = False
+                except Exception:
+                    conn.close()
+                    HealthChecker._api_conn = None
+                    raise
+    
     def check_api_responsiveness(self) -> bool:
         """
         Test internal API responsiveness.
@@ -244,27 +516,21 @@ class HealthChecker:
         start_time = time.time()
         
         try:
-            import requests
-            
             # Test API health endpoint
-            url = f"http://localhost:{self.config['api_port']}/health"
-            response = requests.get(
-                url, 
-                timeout=self.config['health_timeout'],
-                headers={'User-Agent': 'HealthCheck/1.0'}
-            )
+            url = f"http://localhost:{self.config.api_port}/health"
+            status_code, body = self._api_get('/health')
             
             duration = time.time() - start_time
             
-            if response.status_code == 200:
+            if status_code == 200:
                 try:
-                    data = response.json()
+                    data = _loads(body)
                     self.add_result(
                         'api_responsiveness',
                         'pass',
                         'API health endpoint responding',
                         {
-                            'status_code': response.status_code,
+                            'status_code': status_code,
                             'response_time_ms': round(duration * 1000, 2),
                             'response_data': data
                         },
@@ -276,8 +542,8 @@ class HealthChecker:
                         'warning',
                         'API responding but returned invalid JSON',
                         {
-                            'status_code': response.status_code,
-                            'response_text': response.text[:200]
+                            'status_code': status_code,
+                            'response_text': body[:200].decode('utf-8', errors='replace')
                         },
                         duration
                     )
@@ -286,31 +552,33 @@ class HealthChecker:
                 self.add_result(
                     'api_responsiveness',
                     'fail',
-                    f'API returned status code {response.status_code}',
+                    f'API returned status code {status_code}',
                     {
-                        'status_code': response.status_code,
-                        'response_text': response.text[:200]
+                        'status_code': status_code,
+                        'response_text': body[:200].decode('utf-8', errors='replace')
                     },
                     duration
                 )
                 return False
                 
-        except ImportError:
+        except TimeoutError:
+            duration = time.time() - start_time
             self.add_result(
                 'api_responsiveness',
-                'warning',
-                'requests module not available for API check',
-                {'error': 'Missing requests dependency'}
+                'fail',
+                f'API endpoint did not respond within {self.config.health_timeout}s',
+                {'url': url, 'timeout': self.config.health_timeout},
+                duration
             )
-            return True  # Don't fail health check for missing optional dependency
+            return False
             
-        except requests.exceptions.ConnectioError:
+        except ConnectionError:
             duration = time.time() - start_time
             self.add_result(
                 'api_responsiveness',
                 'fail',
                 'Cannot connect to API endpoint',
-                {'url': url, 'timeout': self.config['health_timeout']},
+                {'url': url, 'timeout': self.config.health_timeout},
                 duration
             )
             return False
@@ -336,36 +604,47 @@ class HealthChecker:
         start_time = time.time()
         
         try:
-            import shutil
-            
             # Check critical directories
             critical_paths = ['/app', '/app/logs', '/app/audio', '/app/temp']
-            path_stats = {}
+            path_stats = {path: {'exists': False} for path in critical_paths}
+            existing_paths = [path for path in critical_paths if self._path_exists(path)]
+            slow_paths = []
             
-            for path in critical_paths:
-                if os.path.exists(path):
-                    try:
-                        total, used, free = shutil.disk_usage(path)
-                        used_percent = (used / total) * 100
-                        
-                        path_stats[path] = {
-                            'total_bytes': total,
-                            'used_bytes': used,
-                            'free_bytes': free,
-                            'used_percent': round(used_percent, 2),
-                            'exists': True
-                        }
-                    except Exception as e:
-                        path_stats[path] = {
-                            'exists': True,
-                            'error': str(e)
-                        }
-                else:
-                    path_stats[path] = {'exists': False}
+            # Query paths concurrently so one slow mount doesn't serialize the
+            # rest, and a stuck one can't hold up the probe's exit
+            if existing_paths:
+                futures = {_submit_daemon(shutil.disk_usage, path): path for path in existing_paths}
+                try:
+                    for future in as_completed(futures, timeout=self.config.health_timeout):
+                        path = futures[future]
+                        try:
+                            total, used, free = future.result()
+                            used_percent = (used / total) * 100
+                            
+                            path_stats[path] = {
+                                'total_bytes': total,
+                                'used_bytes': used,
+                                'free_bytes': free,
+                                'used_percent': round(used_percent, 2),
+                                'exists': True
+                            }
+                        except Exception as e:
+                            path_stats[path] = {
+                                'exists': True,
+                                'error': str(e)
+                            }
+                except FuturesTimeoutError:
+                    for future, path in futures.items():
+                        if not future.done():
+                            slow_paths.append(path)
+                            path_stats[path] = {
+                                'exists': True,
+                                'error': f"disk usage query timed out after {self.config.health_timeout}s"
+                            }
             
             # Check if any path has critically low space
             critical_space = False
-            warning_space = False
+            warning_space = bool(slow_paths)
             
             for path, stats in path_stats.items():
                 if 'used_percent' in stats:
@@ -386,10 +665,13 @@ class HealthChecker:
                 )
                 return False
             elif warning_space:
+                message = 'Warning: Filesystem space usage > 85%'
+                if slow_paths:
+                    message = f'Warning: Slow filesystem response for {", ".join(slow_paths)}'
                 self.add_result(
                     'filesystem_health',
                     'warning',
-                    'Warning: Filesystem space usage > 85%',
+                    message,
                     {'path_stats': path_stats},
                     duration
                 )
@@ -430,26 +712,38 @@ class HealthChecker:
             
             # Check memory usage
             try:
-                with open(f'/proc/{current_pid}/status', 'r') as f:
-                    status_content = f.read()
-                    
-                # Parse memory information
-                memory_info = {}
-                for line in status_content.split('\n'):
-                    if line.startswith('VmRSS:'):
-                        memory_info['rss_kb'] = int(line.split()[1])
-                    elif line.startswith('VmSize:'):
-                        memory_info['size_kb'] = int(line.split()[1])
+                if resource is not None:
+                    # Single syscall; ru_maxrss is the peak RSS, in KB on Linux
+                    # but bytes on macOS
+                    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                    if sys.platform == 'darwin':
+                        max_rss //= 1024
+                    memory_info = {'max_rss_kb': max_rss}
+                else:
+                    with open('/proc/self/status', 'rb') as f:
+                        status_content = f.read()
+                        
+                    # Parse memory information
+                    memory_info = {
+                        _STATUS_KEYS[key]: int(value)
+                        for key, value in _STATUS_RE.findall(status_content)
+                    }
                 
                 duration = time.time() - start_time
                 
-                # Check for excessive memory usage (> 1GB)
-                rss_mb = memory_info.get('rss_kb', 0) / 1024
+                # Check for excessive memory usage (> 1GB); getrusage only
+                # reports the peak RSS
+                if 'max_rss_kb' in memory_info:
+                    rss_mb = memory_info['max_rss_kb'] / 1024
+                    usage_label = 'peak memory usage'
+                else:
+                    rss_mb = memory_info.get('rss_kb', 0) / 1024
+                    usage_label = 'memory usage'
                 if rss_mb > 1024:
                     self.add_result(
                         'process_health',
                         'warning',
-                        f'High memory usage: {rss_mb:.1f}MB',
+                        f'High {usage_label}: {rss_mb:.1f}MB',
                         {
                             'pid': current_pid,
                             'memory_info': memory_info
@@ -460,7 +754,7 @@ class HealthChecker:
                     self.add_result(
                         'process_health',
                         'pass',
-                        f'Process healthy, memory usage: {rss_mb:.1f}MB',
+                        f'Process healthy, {usage_label}: {rss_mb:.1f}MB',
                         {
                             'pid': current_pid,
                             'memory_info': memory_info
@@ -470,7 +764,7 @@ class HealthChecker:
                 return True
                 
             except FileNotFoundError:
-                # /proc not available (non-Linux system)
+                # Neither getrusage nor /proc available
                 duration = time.time() - start_time
                 self.add_result(
                     'process_health',
@@ -504,26 +798,26 @@ class HealthChecker:
         try:
             # Check if configuration file exists
             config_file = os.getenv('CONFIG_FILE', '/app/config/config.ini')
-            config_exists = os.path.exists(config_file)
+            config_exists = self._path_exists(config_file)
             
             # Check if log directory is writable
             log_dir = '/app/logs'
-            log_writable = os.access(log_dir, os.W_OK) if os.path.exists(log_dir) else False
+            log_writable = self._is_writable(log_dir)
             
             # Check if audio directory is writable
             audio_dir = '/app/audio'
-            audio_writable = os.access(audio_dir, os.W_OK) if os.path.exists(audio_dir) else False
+            audio_writable = self._is_writable(audio_dir)
             
             # Check for recent log activity
             recent_logs = False
-            if os.path.exists(log_dir):
+            if self._path_exists(log_dir):
                 try:
-                    log_files = [f for f in os.listdir(log_dir) if f.endswith('.log')]
-                    for log_file in log_files:
-                        log_path = os.path.join(log_dir, log_file)
-                        if os.path.getmtime(log_path) > time.time() - 300:  # 5 minutes
-                            recent_logs = True
-                            break
+                    recent_cutoff = time.time() - 300  # 5 minutes
+                    with os.scandir(log_dir) as entries:
+                        for entry in entries:
+                            if entry.name.endswith('.log') and entry.stat().st_mtime > recent_cutoff:
+                                recent_logs = True
+                                break
                 except Exception:
                     pass
             
@@ -576,17 +870,14 @@ class HealthChecker:
             )
             return False
     
-    def run_all_checks(self) -> Tuple[int, Dict]:
+    def _get_checks(self) -> List:
         """
-        Run all health checks and return results.
+        Get the list of health checks to run.
         
         Returns:
-            Tuple[int, Dict]: Exit code and results dictionary
+            List: Bound check methods
         """
-        logger.info("Starting comprehensive health check...")
-        
-        # Run all health checks
-        checks = [
+        return [
             self.check_database_connectivity,
             self.check_redis_connectivity,
             self.check_api_responsiveness,
@@ -594,18 +885,99 @@ class HealthChecker:
             self.check_process_health,
             self.check_application_specific
         ]
+    
+    def _record_check_exception(self, check, error: Exception):
+        """
+        Record a check that raised instead of reporting its own result.
         
-        for check in checks:
-            try:
-                check()
-            except Exception as e:
-                logger.error(f"Unexpected error in {check.__name__}: {e}")
-                self.add_result(
-                    check.__name__,
-                    'fail',
-                    f'Check failed with exception: {str(e)}',
-                    {'error_type': type(e).__name__}
-                )
+        Args:
+            check: Check method that raised
+            error: Exception raised by the check
+        """
+        logger.error("Unexpected error in %s: %s", check.__name__, error)
+        self.add_result(
+            check.__name__,
+            'fail',
+            f'Check failed with exception: {str(error)}',
+            {'error_type': type(error).__name__}
+        )
+    
+    def _record_check_timeout(self, check, deadline: float):
+        """
+        Record a check that did not finish before the probe deadline.
+        
+        Args:
+            check: Check method that timed out
+            deadline: Probe deadline in seconds
+        """
+        logger.error("Health check %s exceeded %ss deadline", check.__name__, deadline)
+        self.add_result(
+            check.__name__,
+            'fail',
+            f'Check did not complete within {deadline}s',
+            {'error_type': 'TimeoutError'}
+        )
+    
+    def run_all_checks(self) -> Tuple[int, Optional[Dict]]:
+        """
+        Run all health checks and return results.
+        
+        Returns:
+            Tuple[int, Optional[Dict]]: Exit code and results dictionary
+            (None when HEALTH_OUTPUT_FORMAT is 'none')
+        """
+        logger.info("Starting comprehensive health check...")
+        self._probe_ts = datetime.now(timezone.utc).isoformat()
+        self._stat_cache.clear()
+        self._access_cache.clear()
+        
+        # Run all health checks
+        checks = self._get_checks()
+        
+        # Checks are independent and I/O-bound, so run them concurrently;
+        # total latency becomes roughly that of the slowest check
+        deadline = self.config.health_timeout * 1.5
+        futures = {_submit_daemon(check): check for check in checks}
+        
+        try:
+            for future in as_completed(futures, timeout=deadline):
+                try:
+                    future.result()
+                except Exception as e:
+                    self._record_check_exception(futures[future], e)
+        except FuturesTimeoutError:
+            for future, check in futures.items():
+                if not future.done():
+                    self._record_check_timeout(check, deadline)
+        
+        # Checks still stuck past the deadline are left running on their
+        # daemon threads; ignore anything they report from now on
+        with self._results_lock:
+            self._sealed = True
+        
+        return self._summarize()
+    
+    def _summarize(self) -> Tuple[int, Optional[Dict]]:
+        """
+        Build the probe summary and exit code from the recorded results.
+        
+        Returns:
+            Tuple[int, Optional[Dict]]: Exit code and results dictionary
+            (None when results are not being kept)
+        """
+        # Determine exit code
+        if self.checks_failed > 0:
+            exit_code = 1  # Critical failures
+        elif self.checks_warning > 0:
+            exit_code = 2  # Warnings
+        else:
+            exit_code = 0  # All healthy
+        
+        logger.info("Health check completed: %d passed, %d failed, %d warnings",
+                    self.checks_passed, self.checks_failed, self.checks_warning)
+        
+        if not self.keep_results:
+            return exit_code, None
         
         # Calculate total duration
         total_duration = time.time() - self.start_time
@@ -624,20 +996,8 @@ class HealthChecker:
             'results': self.results
         }
         
-        # Determine exit code
-        if self.checks_failed > 0:
-            exit_code = 1  # Critical failures
-        elif self.checks_warning > 0:
-            exit_code = 2  # Warnings
-        else:
-            exit_code = 0  # All healthy
-        
-        logger.info(f"Health check completed: {self.checks_passed} passed, "
-                   f"{self.checks_failed} failed, {self.checks_warning} warnings")
-        
         return exit_code, summary
 
-
 def main():
     """Main function to run health checks."""
     try:
@@ -650,8 +1010,10 @@ def main():
         # Output results
         output_format = os.getenv('HEALTH_OUTPUT_FORMAT', 'json').lower()
         
-        if output_format == 'json':
-            print(json.dumps(results, indent=2))
+        if results is None:
+            pass  # HEALTH_OUTPUT_FORMAT=none - exit code only
+        elif output_format == 'json':
+            print(_dumps(results))
         else:
             # Human-readable output
             print(f"Health Check Summary - Status: {results['overall_status'].upper()}")
@@ -674,7 +1036,7 @@ def main():
         sys.exit(130)
         
     except Exception as e:
-        logger.error(f"Unexpected error during health check: {e}")
+        logger.error("Unexpected error during health check: %s", e)
         print(json.dumps({
             'timestamp': datetime.now(timezone.utc).isoformat(),
             'overall_status': 'error',
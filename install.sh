@@ -337,7 +337,7 @@ create_scripts() {
 requests==2.31.0
 psycopg2-binary==2.9.9
 pydub==0.25.1
-schedule==1.2.0
+numpy==1.26.2
 python-dateutil==2.8.2
 psutil==5.9.6
 flask==3.0.0
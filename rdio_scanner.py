@@ -15,38 +15,66 @@ Dependencies:
     - requests: HTTP client library for API calls
     - psycopg2-binary: PostgreSQL database adapter
     - pydub: Audio processing and manipulation
-    - schedule: Task scheduling library
+    - numpy: Vectorized audio sample processing
 """
 
 import sys
+import argparse
 import os
 import time
 import json
 import logging
+import math
 import configparser
 import signal
+import ssl
 import threading
+import heapq
+import itertools
+import contextlib
+import functools
+import io
+import queue
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from dataclasses import dataclass, asdict
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 import hashlib
+import shutil
 import uuid
+import weakref
 
 # Third-party imports
 import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 import psycopg2
-from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.extras import RealDictCursor, Json, execute_values
 from psycopg2.pool import ThreadedConnectionPool
-import schedule
+from psycopg2.extensions import connection as PGConnection
+import numpy as np
 from pydub import AudioSegment
 from pydub.utils import which
 from flask import Flask, jsonify
 import gunicorn
 
+# Prefer orjson for API responses and call metadata, falling back to the
+# standard library when it isn't installed
+try:
+    import orjson
+    
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+    
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 # Configure logging format and level
 logging.basicConfig(
     level=logging.INFO,
@@ -55,8 +83,277 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Columns written for each call record, in COPY/INSERT order
+CALL_COLUMNS = (
+    'call_id', 'timestamp', 'frequency', 'talkgroup', 'source', 'duration',
+    'audio_url', 'audio_file_path', 'system_name', 'department', 'call_type',
+    'units', 'metadata', 'processed'
+)
+
+# Conflict handling shared by the call record upserts
+CALL_UPSERT_CLAUSE = """
+        ON CONFLICT (call_id) DO UPDATE SET
+            timestamp = EXCLUDED.timestamp,
+            frequency = EXCLUDED.frequency,
+            talkgroup = EXCLUDED.talkgroup,
+            source = EXCLUDED.source,
+            duration = EXCLUDED.duration,
+            audio_url = EXCLUDED.audio_url,
+            audio_file_path = EXCLUDED.audio_file_path,
+            system_name = EXCLUDED.system_name,
+            department = EXCLUDED.department,
+            call_type = EXCLUDED.call_type,
+            units = EXCLUDED.units,
+            metadata = EXCLUDED.metadata,
+            processed = EXCLUDED.processed,
+            updated_at = NOW()
+"""
+
+# Single-record upsert, parsed and planned once per connection with PREPARE
+# and then run with EXECUTE
+CALL_PREPARE_SQL = f"""
+        PREPARE insert_call (
+            varchar, timestamptz, double precision, varchar, varchar,
+            double precision, text, text, varchar, varchar, varchar,
+            text[], jsonb, boolean
+        ) AS
+        INSERT INTO calls ({', '.join(CALL_COLUMNS)}) VALUES (
+            $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14
+        )
+        {CALL_UPSERT_CLAUSE}
+"""
+CALL_EXECUTE_SQL = "EXECUTE insert_call (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+
+# Prepended to the first statement of an ingest transaction so it commits
+# without waiting for its WAL flush, at no extra round trip; a crash can lose
+# the last few such commits but never corrupts data
+ASYNC_COMMIT_SQL = "SET LOCAL synchronous_commit = off; "
+
+# Multi-row upsert expanded by execute_values
+CALL_VALUES_UPSERT_SQL = f"""
+        INSERT INTO calls ({', '.join(CALL_COLUMNS)}) VALUES %s
+        {CALL_UPSERT_CLAUSE}
+"""
+CALL_VALUES_TEMPLATE = "(%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s::jsonb,%s)"
+
+# Staged COPY upsert: load a transaction-scoped table, then merge it
+CALL_STAGE_CREATE_SQL = "CREATE TEMP TABLE calls_stage (LIKE calls INCLUDING DEFAULTS) ON COMMIT DROP"
+CALL_STAGE_COPY_SQL = f"COPY calls_stage ({', '.join(CALL_COLUMNS)}) FROM STDIN"
+CALL_STAGE_MERGE_SQL = f"""
+        INSERT INTO calls ({', '.join(CALL_COLUMNS)})
+        SELECT {', '.join(CALL_COLUMNS)} FROM calls_stage
+        {CALL_UPSERT_CLAUSE}
+"""
+
+# Nanoseconds per second, for monotonic_ns deadlines
+NS_PER_SECOND = 1_000_000_000
 
-@dataclass
+# Maximum number of expired call records deleted per cleanup transaction
+CLEANUP_BATCH_SIZE = 5000
+
+
+# Window length in milliseconds over which AGC measures signal level
+AGC_WINDOW_MS = 5.0
+
+# HTTP methods retried by the API client, and the longest backoff sleep
+# between retries in seconds
+RETRY_METHODS = frozenset(["HEAD", "GET", "OPTIONS"])
+RETRY_BACKOFF_MAX = 30
+
+# Block size used when streaming audio downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Read size for checksumming when hashlib.file_digest isn't available
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
+
+def _cpu_has_sha_extensions() -> Optional[bool]:
+    """
+    Check whether the CPU advertises SHA-256 instructions.
+    
+    Looks for the x86 sha_ni flag or the ARMv8 sha2 feature in /proc/cpuinfo.
+    
+    Returns:
+        Optional[bool]: True or False, None if cpuinfo couldn't be read
+    """
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                if line.startswith(('flags', 'Features')):
+                    features = line.partition(':')[2].split()
+                    return 'sha_ni' in features or 'sha2' in features
+    except OSError:
+        return None
+    return False
+
+
+# datetime.fromisoformat accepts a trailing 'Z' (UTC) from Python 3.11 on
+ISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# API field names accepted for each call record attribute, in priority order
+CALL_FIELD_ALIASES = {
+    'call_id': ('id', 'call_id'),
+    'timestamp': ('timestamp', 'time', 'datetime'),
+    'talkgroup': ('talkgroup', 'tg'),
+    'source': ('source', 'src'),
+    'audio_url': ('audio_url', 'audioUrl', 'audio', 'file'),
+    'system_name': ('system', 'system_name'),
+    'department': ('department', 'agency'),
+    'call_type': ('type', 'call_type'),
+}
+
+
+def _prestart_workers(executor: ThreadPoolExecutor, workers: int):
+    """
+    Start every worker thread of a ThreadPoolExecutor immediately.
+    
+    Each submitted task blocks on a shared barrier, so the pool cannot reuse
+    an idle worker and has to start a new thread for every task.
+    
+    Args:
+        executor: Executor to start workers for
+        workers: The executor's max_workers
+    """
+    barrier = threading.Barrier(workers, timeout=10)
+    futures = [executor.submit(barrier.wait) for _ in range(workers)]
+    for future in futures:
+        future.result()
+
+
+@functools.lru_cache(maxsize=4)
+def _read_config(path: str, mtime_ns: int) -> configparser.ConfigParser:
+    """
+    Parse a configuration file, reusing the result until the file changes.
+    
+    The modification time is part of the cache key, so an edited file is
+    parsed again. Callers share the returned parser and must not modify it.
+    
+    Args:
+        path: Path to the configuration file
+        mtime_ns: File modification time in nanoseconds
+        
+    Returns:
+        configparser.ConfigParser: Parsed configuration
+    """
+    config = configparser.ConfigParser()
+    config.read(path)
+    return config
+
+
+def _first_field(api_call: Dict, keys: tuple) -> Any:
+    """
+    Look up the first non-empty value among alternative API field names.
+    
+    Equivalent to api_call.get(keys[0]) or api_call.get(keys[1]) or ...
+    
+    Args:
+        api_call: Raw call data from API
+        keys: Field names to try, in priority order
+        
+    Returns:
+        Any: First truthy value, otherwise the value of the last key
+    """
+    value = None
+    for key in keys:
+        value = api_call.get(key)
+        if value:
+            return value
+    return value
+
+
+class FileSizeLimitExceeded(Exception):
+    """Raised when a download grows past the configured size limit."""
+
+
+class LimitedReader:
+    """
+    File-like wrapper that stops reading once a byte limit is exceeded.
+    
+    Lets a download be copied with shutil.copyfileobj while still aborting
+    early when the response is larger than allowed.
+    """
+    
+    def __init__(self, raw, limit: int):
+        """
+        Wrap a readable stream.
+        
+        Args:
+            raw: Underlying file-like object to read from
+            limit: Maximum number of bytes allowed (0 = unlimited)
+        """
+        self.raw = raw
+        self.limit = limit
+        self.bytes_read = 0
+    
+    def read(self, size: int = -1) -> bytes:
+        """Read from the wrapped stream, raising once the limit is passed."""
+        data = self.raw.read(size)
+        self.bytes_read += len(data)
+        if self.limit > 0 and self.bytes_read > self.limit:
+            raise FileSizeLimitExceeded(f"Read {self.bytes_read} bytes, limit is {self.limit}")
+        return data
+
+
+class PooledConnection(PGConnection):
+    """
+    psycopg2 connection used by the pool.
+    
+    Plain psycopg2 connections can't be weakly referenced; this subclass can,
+    so per-connection state (such as prepared statements) can be tracked
+    without keeping closed connections alive. It also records when it was
+    opened so long-lived connections can be recycled.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.opened_at = time.monotonic()
+
+
+def _pg_array_literal(values: Optional[List[str]]) -> Optional[str]:
+    """
+    Encode a list of strings as a PostgreSQL array literal.
+    
+    Args:
+        values: List of strings to encode; None elements become NULL
+        
+    Returns:
+        Optional[str]: Array literal such as {"a",NULL}, None for NULL
+    """
+    if values is None:
+        return None
+    escaped = (
+        'NULL' if value is None else
+        '"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"'
+        for value in values
+    )
+    return '{' + ','.join(escaped) + '}'
+
+
+# Escapes for COPY text format fields
+_COPY_TEXT_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '\t': '\\t',
+    '\n': '\\n',
+    '\r': '\\r',
+})
+
+
+def _copy_text_field(value: Any) -> str:
+    """
+    Encode a single value as a COPY text format field.
+    
+    Args:
+        value: Value to encode (already converted to a str-compatible form)
+        
+    Returns:
+        str: Escaped field, \\N for NULL
+    """
+    if value is None:
+        return '\\N'
+    return str(value).translate(_COPY_TEXT_ESCAPES)
+
+
+@dataclass(slots=True)
 class CallRecord:
     """
     Data class representing a single call record from Rdio Scanner.
@@ -98,6 +395,25 @@ class CallRecord:
             if isinstance(value, datetime):
                 data[key] = value.isoformat()
         return data
+    
+    def to_row(self) -> tuple:
+        """
+        Convert CallRecord to a tuple of values in CALL_COLUMNS order.
+        
+        Avoids asdict's recursive copy for the insert paths; datetimes are
+        left for psycopg2 to adapt and metadata is wrapped in a Json adapter
+        so it is serialized when the parameters are bound.
+        
+        Returns:
+            tuple: Column values ready to be bound to an INSERT
+        """
+        return (
+            self.call_id, self.timestamp, self.frequency, self.talkgroup,
+            self.source, self.duration, self.audio_url, self.audio_file_path,
+            self.system_name, self.department, self.call_type, self.units,
+            Json(self.metadata, dumps=_json_dumps) if self.metadata else None,
+            self.processed
+        )
 
 
 class DatabaseManager:
@@ -109,16 +425,45 @@ class DatabaseManager:
     and performance optimization features.
     """
     
-    def __init__(self, config: configparser.ConfigParser):
+    def __init__(self, config: configparser.ConfigParser, durable: Optional[bool] = None):
         """
         Initialize database manager with configuration.
         
         Args:
             config: ConfigParser object containing database settings
+            durable: Wait for the WAL flush when committing call inserts;
+                defaults to the durable_commits database setting
         """
         self.config = config
         self.connection_pool = None
-        self.lock = threading.Lock()
+        
+        # Call inserts commit asynchronously unless full durability is asked
+        # for; every other transaction keeps the server's durable default
+        if durable is None:
+            durable = config.getboolean('database', 'durable_commits', fallback=False)
+        self.durable = durable
+        self.insert_sql_prefix = '' if durable else ASYNC_COMMIT_SQL
+        
+        # Connections on which the single-record insert has been PREPAREd
+        self.prepared_connections = weakref.WeakSet()
+        
+        # Pooled connections older than this many seconds are closed when
+        # returned instead of being reused (0 keeps them indefinitely)
+        self.connection_max_age = config.getint('database', 'connection_max_age', fallback=1800)
+        
+        # Batches smaller than this go out as a single multi-row VALUES upsert,
+        # which beats the three statements of the COPY path; the two break even
+        # around 100 rows, so the default matches a full API response
+        self.copy_min_batch_size = max(1, config.getint('database', 'copy_min_batch_size', fallback=100))
+        
+        # Large batches are split by call_id across this many connections
+        self.insert_shards = max(1, config.getint('database', 'insert_shards', fallback=1))
+        self.insert_executor = None
+        if self.insert_shards > 1:
+            self.insert_executor = ThreadPoolExecutor(
+                max_workers=self.insert_shards,
+                thread_name_prefix='db-insert'
+            )
         
         # Database connection parameters - handle environment variables
         self.db_params = {
@@ -148,6 +493,7 @@ class DatabaseManager:
             self.connection_pool = ThreadedConnectionPool(
                 minconn=1,
                 maxconn=pool_size,
+                connection_factory=PooledConnection,
                 **self.db_params
             )
             logger.info(f"Database connection pool initialized with {pool_size} connections")
@@ -266,9 +612,13 @@ class DatabaseManager:
             raise
     
     def return_connection(self, conn):
-        """Return a database connection to the pool."""
+        """Return a database connection to the pool, retiring it if it's too old."""
         try:
-            self.connection_pool.putconn(conn)
+            expired = (
+                self.connection_max_age > 0 and
+                time.monotonic() - getattr(conn, 'opened_at', 0.0) > self.connection_max_age
+            )
+            self.connection_pool.putconn(conn, close=expired)
         except psycopg2.Error as e:
             logger.error(f"Failed to return database connection: {e}")
     
@@ -282,46 +632,21 @@ class DatabaseManager:
         Returns:
             bool: True if insert was successful, False otherwise
         """
-        insert_sql = """
-        INSERT INTO calls (
-            call_id, timestamp, frequency, talkgroup, source, duration,
-            audio_url, audio_file_path, system_name, department, call_type,
-            units, metadata, processed
-        ) VALUES (
-            %(call_id)s, %(timestamp)s, %(frequency)s, %(talkgroup)s, %(source)s,
-            %(duration)s, %(audio_url)s, %(audio_file_path)s, %(system_name)s,
-            %(department)s, %(call_type)s, %(units)s, %(metadata)s, %(processed)s
-        ) ON CONFLICT (call_id) DO UPDATE SET
-            timestamp = EXCLUDED.timestamp,
-            frequency = EXCLUDED.frequency,
-            talkgroup = EXCLUDED.talkgroup,
-            source = EXCLUDED.source,
-            duration = EXCLUDED.duration,
-            audio_url = EXCLUDED.audio_url,
-            audio_file_path = EXCLUDED.audio_file_path,
-            system_name = EXCLUDED.system_name,
-            department = EXCLUDED.department,
-            call_type = EXCLUDED.call_type,
-            units = EXCLUDED.units,
-            metadata = EXCLUDED.metadata,
-            processed = EXCLUDED.processed,
-            updated_at = NOW()
-        """
-        
         try:
             conn = self.get_connection()
             try:
-                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                    # Convert CallRecord to dictionary for database insertion
-                    record_dict = call_record.to_dict()
-                    # Convert metadata to JSON if it exists
-                    if record_dict.get('metadata'):
-                        record_dict['metadata'] = json.dumps(record_dict['metadata'])
+                with conn.cursor() as cursor:
+                    if conn not in self.prepared_connections:
+                        cursor.execute(CALL_PREPARE_SQL)
+                        self.prepared_connections.add(conn)
                     
-                    cursor.execute(insert_sql, record_dict)
+                    cursor.execute(self.insert_sql_prefix + CALL_EXECUTE_SQL, call_record.to_row())
                 conn.commit()
                 logger.debug(f"Successfully inserted call record: {call_record.call_id}")
                 return True
+            except psycopg2.Error:
+                conn.rollback()
+                raise
             finally:
                 self.return_connection(conn)
         except psycopg2.Error as e:
@@ -332,6 +657,14 @@ class DatabaseManager:
         """
         Insert multiple call records in a batch operation.
         
+        Small batches are sent as a single multi-row VALUES upsert; larger
+        ones are streamed with COPY into a staging table and then merged.
+        With insert_shards above one, batches large enough to give every
+        shard a full COPY are split by call_id and written concurrently on
+        separate connections, each in its own transaction. A sharded batch is
+        therefore not atomic: if one shard fails, the others stay committed
+        and the returned count only covers the committed shards.
+        
         Args:
             call_records: List of CallRecord objects to insert
             
@@ -341,68 +674,125 @@ class DatabaseManager:
         if not call_records:
             return 0
         
-        insert_sql = """
-        INSERT INTO calls (
-            call_id, timestamp, frequency, talkgroup, source, duration,
-            audio_url, audio_file_path, system_name, department, call_type,
-            units, metadata, processed
-        ) VALUES %s
-        ON CONFLICT (call_id) DO UPDATE SET
-            timestamp = EXCLUDED.timestamp,
-            frequency = EXCLUDED.frequency,
-            talkgroup = EXCLUDED.talkgroup,
-            source = EXCLUDED.source,
-            duration = EXCLUDED.duration,
-            audio_url = EXCLUDED.audio_url,
-            audio_file_path = EXCLUDED.audio_file_path,
-            system_name = EXCLUDED.system_name,
-            department = EXCLUDED.department,
-            call_type = EXCLUDED.call_type,
-            units = EXCLUDED.units,
-            metadata = EXCLUDED.metadata,
-            processed = EXCLUDED.processed,
-            updated_at = NOW()
+        shard_count = min(self.insert_shards, len(call_records) // self.copy_min_batch_size)
+        if shard_count > 1:
+            # Hashing on call_id keeps duplicates of a call in the same shard
+            shards = [[] for _ in range(shard_count)]
+            for record in call_records:
+                shards[hash(record.call_id) % shard_count].append(record)
+            shard_counts = list(self.insert_executor.map(self._insert_batch, shards))
+            inserted_count = sum(shard_counts)
+            failed_shards = shard_counts.count(0)
+            if failed_shards:
+                logger.warning(
+                    f"Batch partially inserted: {failed_shards} of {shard_count} shards failed, "
+                    f"rows per shard {shard_counts}"
+                )
+            else:
+                logger.debug(f"Rows inserted per shard: {shard_counts}")
+        else:
+            inserted_count = self._insert_batch(call_records)
+        
+        if inserted_count:
+            logger.info(f"Successfully inserted {inserted_count} call records in batch")
+        return inserted_count
+    
+    def _insert_batch(self, call_records: List[CallRecord]) -> int:
         """
+        Upsert a batch of call records in one transaction on one connection.
+        
+        Args:
+            call_records: List of CallRecord objects to insert
+            
+        Returns:
+            int: Number of records inserted, 0 if the transaction failed
+        """
+        # An upsert can't touch the same row twice in one statement, so keep
+        # only the last record seen for each call_id
+        call_records = list({record.call_id: record for record in call_records}.values())
         
         try:
             conn = self.get_connection()
             try:
                 with conn.cursor() as cursor:
-                    # Prepare data for batch insertion
-                    records_data = []
-                    for record in call_records:
-                        record_dict = record.to_dict()
-                        if record_dict.get('metadata'):
-                            record_dict['metadata'] = json.dumps(record_dict['metadata'])
-                        
-                        records_data.append((
-                            record_dict['call_id'],
-                            record_dict['timestamp'],
-                            record_dict['frequency'],
-                            record_dict['talkgroup'],
-                            record_dict['source'],
-                            record_dict['duration'],
-                            record_dict['audio_url'],
-                            record_dict['audio_file_path'],
-                            record_dict['system_name'],
-                            record_dict['department'],
-                            record_dict['call_type'],
-                            record_dict['units'],
-                            record_dict['metadata'],
-                            record_dict['processed']
-                        ))
-                    
-                    # Execute batch insert
-                    execute_values(cursor, insert_sql, records_data)
+                    if len(call_records) < self.copy_min_batch_size:
+                        inserted_count = self._upsert_with_values(cursor, call_records)
+                    else:
+                        inserted_count = self._upsert_with_copy(cursor, call_records)
                 conn.commit()
-                logger.info(f"Successfully inserted {len(call_records)} call records in batch")
-                return len(call_records)
+                return inserted_count
+            except psycopg2.Error:
+                conn.rollback()
+                raise
             finally:
                 self.return_connection(conn)
         except psycopg2.Error as e:
             logger.error(f"Failed to insert call records batch: {e}")
             return 0
     
+    def _upsert_with_values(self, cursor, call_records: List[CallRecord]) -> int:
+        """
+        Upsert call records with one multi-row INSERT ... VALUES statement.
+        
+        Args:
+            cursor: Database cursor to execute on
+            call_records: List of CallRecord objects to insert
+            
+        Returns:
+            int: Number of rows inserted or updated
+        """
+        records_data = [record.to_row() for record in call_records]
+        
+        # page_size covers the whole batch so it goes out as a single statement
+        execute_values(
+            cursor,
+            self.insert_sql_prefix + CALL_VALUES_UPSERT_SQL,
+            records_data,
+            template=CALL_VALUES_TEMPLATE,
+            page_size=len(records_data)
+        )
+        return len(records_data)
+    
+    def _upsert_with_copy(self, cursor, call_records: List[CallRecord]) -> int:
+        """
+        Upsert call records by COPYing them into a staging table and merging.
+        
+        Args:
+            cursor: Database cursor to execute on
+            call_records: List of CallRecord objects to insert
+            
+        Returns:
+            int: Number of rows inserted or updated
+        """
+        # Staging table only lives for the current transaction
+        cursor.execute(self.insert_sql_prefix + CALL_STAGE_CREATE_SQL)
+        cursor.copy_expert(CALL_STAGE_COPY_SQL, self._records_to_copy_buffer(call_records))
+        cursor.execute(CALL_STAGE_MERGE_SQL)
+        return cursor.rowcount
+    
+    def _records_to_copy_buffer(self, call_records: List[CallRecord]) -> io.StringIO:
+        """
+        Serialize call records in COPY text format for COPY FROM STDIN.
+        
+        Args:
+            call_records: List of CallRecord objects to serialize
+            
+        Returns:
+            io.StringIO: Tab-separated rows positioned at the start
+        """
+        units_index = CALL_COLUMNS.index('units')
+        metadata_index = CALL_COLUMNS.index('metadata')
+        buffer = io.StringIO()
+        for record in call_records:
+            row = list(record.to_row())
+            row[units_index] = _pg_array_literal(row[units_index])
+            if row[metadata_index] is not None:
+                row[metadata_index] = _json_dumps(record.metadata)
+            buffer.write('\t'.join(_copy_text_field(value) for value in row))
+            buffer.write('\n')
+        buffer.seek(0)
+        return buffer
+    
     def get_unprocessed_calls(self, limit: int = 100) -> List[Dict]:
         """
         Retrieve unprocessed call records from the database.
@@ -425,9 +815,11 @@ class DatabaseManager:
             try:
                 with conn.cursor(cursor_factory=RealDictCursor) as cursor:
                     cursor.execute(select_sql, (limit,))
+                    # RealDictRow is already a dict, no need to copy each row
                     records = cursor.fetchall()
-                    logger.debug(f"Retrieved {len(records)} unprocessed call records")
-                    return [dict(record) for record in records]
+                conn.rollback()  # Read-only; end the transaction before pooling
+                logger.debug(f"Retrieved {len(records)} unprocessed call records")
+                return records
             finally:
                 self.return_connection(conn)
         except psycopg2.Error as e:
@@ -465,6 +857,45 @@ class DatabaseManager:
             logger.error(f"Failed to mark call {call_id} as processed: {e}")
             return False
     
+    def mark_calls_processed(self, call_ids: List[str]) -> int:
+        """
+        Mark multiple call records as processed in a single statement.
+        
+        Args:
+            call_ids: Unique identifiers of the calls to mark as processed
+            
+        Returns:
+            int: Number of call records updated
+        """
+        if not call_ids:
+            return 0
+        
+        update_sql = """
+        UPDATE calls SET processed = TRUE
+        FROM (VALUES %s) AS v(cid)
+        WHERE calls.call_id = v.cid
+        """
+        
+        try:
+            conn = self.get_connection()
+            try:
+                with conn.cursor() as cursor:
+                    # One page, so rowcount covers every id rather than just
+                    # the last page of a split statement
+                    execute_values(cursor, update_sql, [(call_id,) for call_id in call_ids], page_size=len(call_ids))
+                    rows_updated = cursor.rowcount
+                conn.commit()
+                logger.debug(f"Marked {rows_updated} calls as processed")
+                return rows_updated
+            except psycopg2.Error:
+                conn.rollback()
+                raise
+            finally:
+                self.return_connection(conn)
+        except psycopg2.Error as e:
+            logger.error(f"Failed to mark {len(call_ids)} calls as processed: {e}")
+            return 0
+    
     def get_call_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about stored call records.
@@ -509,29 +940,45 @@ class DatabaseManager:
         Returns:
             int: Number of records deleted
         """
+        # Delete in bounded chunks so each transaction stays short and
+        # doesn't hold locks or generate WAL for the whole backlog at once
         cleanup_sql = """
-        DELETE FROM calls 
-        WHERE created_at < NOW() - INTERVAL '%s days'
+        DELETE FROM calls
+        WHERE id IN (
+            SELECT id FROM calls
+            WHERE created_at < NOW() - make_interval(days => %s)
+            LIMIT %s
+        )
         """
         
+        deleted_count = 0
         try:
             conn = self.get_connection()
             try:
-                with conn.cursor() as cursor:
-                    cursor.execute(cleanup_sql, (days,))
-                    deleted_count = cursor.rowcount
-                conn.commit()
+                while True:
+                    with conn.cursor() as cursor:
+                        cursor.execute(cleanup_sql, (days, CLEANUP_BATCH_SIZE))
+                        batch_deleted = cursor.rowcount
+                    conn.commit()
+                    deleted_count += batch_deleted
+                    if batch_deleted < CLEANUP_BATCH_SIZE:
+                        break
                 logger.info(f"Cleaned up {deleted_count} old call records (older than {days} days)")
                 return deleted_count
+            except psycopg2.Error:
+                conn.rollback()
+                raise
             finally:
                 self.return_connection(conn)
         except psycopg2.Error as e:
             logger.error(f"Failed to cleanup old records: {e}")
-            return 0
+            return deleted_count
     
     def close(self):
         """Close all database connections and cleanup resources."""
         if self.connection_pool:
+            if self.insert_executor:
+                self.insert_executor.shutdown(wait=True)
             self.connection_pool.closeall()
             logger.info("Database connection pool closed")
 
@@ -562,6 +1009,7 @@ class AudioProcessor:
         self.auto_gain_control = config.getboolean('audio', 'auto_gain_control')
         self.normalize_audio = config.getboolean('audio', 'normalize_audio')
         self.retention_days = config.getint('audio', 'retention_days')
+        self.download_workers = config.getint('audio', 'download_workers', fallback=4)
         
         # Create storage directory if it doesn't exist
         self.storage_path.mkdir(parents=True, exist_ok=True)
@@ -571,9 +1019,12 @@ class AudioProcessor:
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
+            backoff_max=RETRY_BACKOFF_MAX,
             status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Size the connection pool so concurrent downloads don't discard connections
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=self.download_workers)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -581,6 +1032,14 @@ class AudioProcessor:
         if not which("ffmpeg"):
             logger.warning("ffmpeg not found. Audio processing capabilities will be limited.")
         
+        # hashlib's sha256 comes from OpenSSL, which uses the CPU's SHA
+        # instructions when present; log both so slow checksums can be explained
+        sha_extensions = _cpu_has_sha_extensions()
+        if sha_extensions is False:
+            logger.info(f"CPU has no SHA extensions; checksums use {ssl.OPENSSL_VERSION} scalar code")
+        else:
+            logger.debug(f"Checksums use {ssl.OPENSSL_VERSION} (CPU SHA extensions: {sha_extensions})")
+        
         logger.info(f"Audio processor initialized - Storage: {self.storage_path}, Format: {self.audio_format}")
     
     def download_audio(self, audio_url: str, call_id: str) -> Optional[Path]:
@@ -611,23 +1070,38 @@ class AudioProcessor:
             
             # Check file size before downloading completely
             content_length = response.headers.get('content-length')
-            if content_length and int(content_length) > self.max_file_size:
+            if self.max_file_size > 0 and content_length and int(content_length) > self.max_file_size:
                 logger.warning(f"Audio file too large ({content_length} bytes) for call {call_id}")
+                response.close()
                 return None
             
-            # Write file to disk
-            with open(file_path, 'wb') as f:
-                downloaded_bytes = 0
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:  # Filter out keep-alive chunks
-                        f.write(chunk)
-                        downloaded_bytes += len(chunk)
-                        
-                        # Check size limit during download
-                        if self.max_file_size > 0 and downloaded_bytes > self.max_file_size:
-                            logger.warning(f"Audio file exceeded size limit during download for call {call_id}")
-                            file_path.unlink()  # Delete partially downloaded file
-                            return None
+            # Write file to disk, copying in large blocks inside shutil rather
+            # than a small-chunk Python loop
+            response.raw.decode_content = True
+            reader = LimitedReader(response.raw, self.max_file_size)
+            try:
+                with response, open(file_path, 'wb') as f:
+                    # Reserve the whole file up front when the size is known so
+                    # the filesystem allocates it in one go instead of per write
+                    if content_length and hasattr(os, 'posix_fallocate'):
+                        try:
+                            os.posix_fallocate(f.fileno(), 0, int(content_length))
+                        except OSError:
+                            pass  # Not supported by this filesystem
+                    shutil.copyfileobj(reader, f, length=DOWNLOAD_CHUNK_SIZE)
+                    # Decoded content can be shorter than the declared length
+                    f.truncate(reader.bytes_read)
+            except FileSizeLimitExceeded:
+                logger.warning(f"Audio file exceeded size limit during download for call {call_id}")
+                file_path.unlink(missing_ok=True)  # Delete partially downloaded file
+                return None
+            except BaseException:
+                # Reading response.raw raises urllib3 errors mid-stream, and the
+                # file may already be preallocated to full size, so never leave
+                # a truncated download behind
+                file_path.unlink(missing_ok=True)
+                raise
+            downloaded_bytes = reader.bytes_read
             
             logger.info(f"Successfully downloaded audio file: {file_path} ({downloaded_bytes} bytes)")
             return file_path
@@ -711,26 +1185,72 @@ class AudioProcessor:
         
         # Normalize to -3dB to prevent clipping while maximizing volume
         target_amplitude = audio.max_possible_amplitude * 0.7  # -3dB
-        gain = target_amplitude / peak_amplitude
+        gain_db = 20.0 * math.log10(target_amplitude / peak_amplitude)
         
         # Apply gain adjustment
-        normalized_audio = audio + (20 * float(gain).bit_length())  # Convert to dB
-        return normalized_audio
+        return audio.apply_gain(gain_db)
     
     def _apply_agc(self, audio: AudioSegment) -> AudioSegment:
         """
         Apply automatic gain control to audio.
         
+        Compresses dynamic range above a -20 dBFS threshold at 4:1 with 5 ms
+        attack and 50 ms release, the settings previously passed to pydub's
+        compress_dynamic_range. Levels are measured per short window with
+        NumPy instead of pydub's per-millisecond Python loop; only the
+        attack/release smoothing steps through the windows.
+        
+        The gain reduction follows a one-pole attack/release envelope, so the
+        output differs from pydub's: the first window of a loud passage
+        already gets about 63% of its reduction (pydub lets the onset through
+        nearly unattenuated), and once the level falls back below the
+        threshold the reduction releases to zero within a few release times,
+        leaving quieter audio at its input level (pydub keeps attenuating it).
+        Steady loud passages come out at the same level.
+        
         Args:
             audio: AudioSegment to apply AGC to
             
         Returns:
             AudioSegment: Audio with AGC applied
         """
-        # Simple AGC implementation - compress dynamic range
-        # This is a basic implementation; more sophisticated AGC could be added
-        compressed = audio.compress_dynamic_range(threshold=-20.0, ratio=4.0, attack=5.0, release=50.0)
-        return compressed
+        threshold_db, ratio, attack_ms, release_ms = -20.0, 4.0, 5.0, 50.0
+        
+        samples = np.array(audio.get_array_of_samples(), dtype=np.float64)
+        if samples.size == 0:
+            return audio
+        full_scale = float(audio.max_possible_amplitude)
+        
+        # Measure the RMS level of each window (all channels together)
+        window = max(1, int(audio.frame_rate * AGC_WINDOW_MS / 1000)) * audio.channels
+        window_count = -(-samples.size // window)
+        padded = np.zeros(window_count * window)
+        padded[:samples.size] = samples / full_scale
+        rms = np.sqrt(np.mean(padded.reshape(window_count, window) ** 2, axis=1))
+        level_db = 20.0 * np.log10(np.maximum(rms, 1e-10))
+        
+        # Gain reduction needed for each window above the threshold
+        target_db = np.where(level_db > threshold_db, (level_db - threshold_db) * (1.0 - 1.0 / ratio), 0.0)
+        
+        # Smooth the reduction with separate attack and release time constants
+        attack = np.exp(-AGC_WINDOW_MS / attack_ms)
+        release = np.exp(-AGC_WINDOW_MS / release_ms)
+        reduction_db = np.empty_like(target_db)
+        current = 0.0
+        for i, target in enumerate(target_db.tolist()):
+            coeff = attack if target > current else release
+            current = target + coeff * (current - target)
+            reduction_db[i] = current
+        
+        gain = np.repeat(10.0 ** (-reduction_db / 20.0), window)[:samples.size]
+        compressed = np.clip(samples * gain, -full_scale, full_scale - 1)
+        
+        return AudioSegment(
+            data=compressed.astype(np.dtype(audio.array_type)).tobytes(),
+            sample_width=audio.sample_width,
+            frame_rate=audio.frame_rate,
+            channels=audio.channels
+        )
     
     def _get_export_params(self) -> Dict[str, Any]:
         """
@@ -766,12 +1286,22 @@ class AudioProcessor:
         if not file_path.exists():
             return ""
         
-        hash_sha256 = hashlib.sha256()
         try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_sha256.update(chunk)
-            return hash_sha256.hexdigest()
+            # Unbuffered: both paths below read straight into their own buffer,
+            # so a BufferedReader would only add a copy
+            with open(file_path, "rb", buffering=0) as f:
+                if hasattr(hashlib, 'file_digest'):
+                    # file_digest runs the read/update loop in C
+                    return hashlib.file_digest(f, "sha256").hexdigest()
+                
+                # Python < 3.11: read into one reused buffer, large enough
+                # to keep the number of read/update calls low
+                hash_sha256 = hashlib.sha256()
+                buffer = bytearray(CHECKSUM_CHUNK_SIZE)
+                view = memoryview(buffer)
+                while (bytes_read := f.readinto(buffer)):
+                    hash_sha256.update(view[:bytes_read])
+                return hash_sha256.hexdigest()
         except Exception as e:
             logger.error(f"Failed to calculate checksum for {file_path}: {e}")
             return ""
@@ -786,26 +1316,8 @@ class AudioProcessor:
         if self.retention_days <= 0:
             return 0  # Keep files forever
         
-        cutoff_date = datetime.now() - timedelta(days=self.retention_days)
-        deleted_count = 0
-        
-        try:
-            for file_path in self.storage_path.glob("*"):
-                if file_path.is_file():
-                    # Get file modification time
-                    file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    
-                    if file_mtime < cutoff_date:
-                        file_path.unlink()
-                        deleted_count += 1
-                        logger.debug(f"Deleted old audio file: {file_path}")
-            
-            logger.info(f"Cleaned up {deleted_count} old audio files (older than {self.retention_days} days)")
-            return deleted_count
-            
-        except Exception as e:
-            logger.error(f"Error during audio file cleanup: {e}")
-            return deleted_count
+        deleted_count, _ = self.sweep_storage(delete_old=True)
+        return deleted_count
     
     def get_storage_stats(self) -> Dict[str, Any]:
         """
@@ -814,47 +1326,89 @@ class AudioProcessor:
         Returns:
             Dict[str, Any]: Storage statistics
         """
+        _, stats = self.sweep_storage(delete_old=False)
+        return stats
+    
+    def sweep_storage(self, delete_old: bool = False) -> Tuple[int, Dict[str, Any]]:
+        """
+        Walk audio storage once, collecting statistics and optionally
+        deleting files past the retention period.
+        
+        Deleted files are not counted in the returned statistics.
+        
+        Args:
+            delete_old: Remove files older than retention_days during the walk
+            
+        Returns:
+            Tuple[int, Dict[str, Any]]: Number of files deleted and storage statistics
+        """
         stats = {
             'total_files': 0,
             'total_size_bytes': 0,
             'total_size_mb': 0,
             'oldest_file': None,
             'newest_file': None,
+            'oldest_file_time': None,
+            'newest_file_time': None,
             'formats': {}
         }
+        deleted_count = 0
+        
+        delete_old = delete_old and self.retention_days > 0
+        if delete_old:
+            # Compared against raw st_mtime floats, so no datetime is built per file
+            cutoff_time = (datetime.now() - timedelta(days=self.retention_days)).timestamp()
         
         try:
-            oldest_time = None
-            newest_time = None
-            
-            for file_path in self.storage_path.glob("*"):
-                if file_path.is_file():
+            oldest_time = math.inf
+            newest_time = -math.inf
+            formats = Counter()
+            
+            # scandir yields file type from the directory entry, so each file
+            # needs only one stat call
+            with os.scandir(self.storage_path) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    
+                    file_stat = entry.stat()
+                    if delete_old and file_stat.st_mtime < cutoff_time:
+                        os.unlink(entry.path)
+                        deleted_count += 1
+                        logger.debug(f"Deleted old audio file: {entry.path}")
+                        continue
+                    
                     stats['total_files'] += 1
-                    file_size = file_path.stat().st_size
-                    stats['total_size_bytes'] += file_size
+                    stats['total_size_bytes'] += file_stat.st_size
                     
-                    # Track file format distribution
-                    file_ext = file_path.suffix.lower().lstrip('.')
-                    if file_ext in stats['formats']:
-                        stats['formats'][file_ext] += 1
-                    else:
-                        stats['formats'][file_ext] = 1
+                    # Track file format distribution; same result as
+                    # Path.suffix, without building a Path per file
+                    stem, _, file_ext = entry.name.rpartition('.')
+                    formats[file_ext.lower() if stem else ''] += 1
                     
-                    # Track oldest and newest files
-                    file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    if oldest_time is None or file_mtime < oldest_time:
+                    # Track oldest and newest files as raw floats; only the
+                    # winners are converted to datetimes after the walk
+                    file_mtime = file_stat.st_mtime
+                    if file_mtime < oldest_time:
                         oldest_time = file_mtime
-                        stats['oldest_file'] = str(file_path)
-                    if newest_time is None or file_mtime > newest_time:
+                        stats['oldest_file'] = entry.path
+                    if file_mtime > newest_time:
                         newest_time = file_mtime
-                        stats['newest_file'] = str(file_path)
+                        stats['newest_file'] = entry.path
             
+            stats['formats'] = dict(formats)
             stats['total_size_mb'] = round(stats['total_size_bytes'] / (1024 * 1024), 2)
+            if stats['total_files']:
+                stats['oldest_file_time'] = datetime.fromtimestamp(oldest_time, tz=timezone.utc).isoformat()
+                stats['newest_file_time'] = datetime.fromtimestamp(newest_time, tz=timezone.utc).isoformat()
+            
+            if delete_old:
+                logger.info(f"Cleaned up {deleted_count} old audio files (older than {self.retention_days} days)")
             
         except Exception as e:
-            logger.error(f"Error getting storage stats: {e}")
+            logger.error(f"Error sweeping audio storage: {e}")
         
-        return stats
+        return deleted_count, stats
 
 
 class RdioScannerClient:
@@ -882,8 +1436,10 @@ class RdioScannerClient:
         self.retry_delay = config.getint('rdio_scanner', 'retry_delay')
         self.max_calls_per_request = config.getint('rdio_scanner', 'max_calls_per_request')
         
-        # Build API endpoint URL
-        self.api_url = urljoin(self.domain + '/', self.api_path)
+        # Build API endpoint URL; base_url is kept so relative audio paths can
+        # be resolved with plain concatenation instead of urljoin per call
+        self.base_url = self.domain + '/'
+        self.api_url = urljoin(self.base_url, self.api_path)
         
         # Setup HTTP session with retry strategy and custom headers
         self.session = requests.Session()
@@ -903,19 +1459,32 @@ class RdioScannerClient:
         retry_strategy = Retry(
             total=self.retry_attempts,
             backoff_factor=self.retry_delay,
+            backoff_max=RETRY_BACKOFF_MAX,
             status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"]
+            allowed_methods=RETRY_METHODS,
+            # Hand back the final response; raise_for_status reports it
+            raise_on_status=False
         )
         adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
+        # Validators from the last poll that returned no calls, and the
+        # parameters it was made with, for conditional re-polls
+        self.empty_poll_params = None
+        self.empty_poll_validators = {}
+        
         logger.info(f"Rdio Scanner client initialized - API URL: {self.api_url}")
     
     def fetch_calls(self, since: Optional[datetime] = None, limit: Optional[int] = None) -> List[Dict]:
         """
         Fetch call records from Rdio Scanner API.
         
+        When a poll with the same parameters last came back empty, its ETag
+        and Last-Modified validators are sent along, so an unchanged result
+        costs a 304 instead of a response to download and parse. The
+        caller's since timestamp stays authoritative for what is fetched.
+        
         Args:
             since: Only fetch calls newer than this timestamp
             limit: Maximum number of calls to fetch
@@ -937,15 +1506,23 @@ class RdioScannerClient:
             
             # Make API request
             logger.debug(f"Fetching calls from API with params: {params}")
+            headers = None
+            if params == self.empty_poll_params:
+                headers = self.empty_poll_validators
             response = self.session.get(
                 self.api_url,
                 params=params,
+                headers=headers,
                 timeout=self.request_timeout
             )
             response.raise_for_status()
             
-            # Parse JSON response
-            data = response.json()
+            if response.status_code == 304:
+                logger.debug("API reports no change since the last empty poll")
+                return []
+            
+            # Parse JSON response straight from the raw bytes
+            data = _json_loads(response.content)
             
             # Handle different API response formats
             if isinstance(data, list):
@@ -958,6 +1535,17 @@ class RdioScannerClient:
                 logger.warning(f"Unexpected API response format: {type(data)}")
                 calls = []
             
+            # Only empty results are safe to answer with a 304 next time
+            self.empty_poll_params = None
+            self.empty_poll_validators = {}
+            if not calls:
+                if 'ETag' in response.headers:
+                    self.empty_poll_validators['If-None-Match'] = response.headers['ETag']
+                if 'Last-Modified' in response.headers:
+                    self.empty_poll_validators['If-Modified-Since'] = response.headers['Last-Modified']
+                if self.empty_poll_validators:
+                    self.empty_poll_params = params
+            
             logger.info(f"Successfully fetched {len(calls)} calls from API")
             return calls
             
@@ -971,6 +1559,19 @@ class RdioScannerClient:
             logger.error(f"Unexpected error fetching calls: {e}")
             return []
     
+    def parse_call_records(self, api_calls: List[Dict]) -> List[CallRecord]:
+        """
+        Parse a batch of API call data into CallRecord objects.
+        
+        Args:
+            api_calls: Raw call data from API
+            
+        Returns:
+            List[CallRecord]: Successfully parsed records; failures are skipped
+        """
+        parse = self.parse_call_record
+        return [record for record in map(parse, api_calls) if record is not None]
+    
     def parse_call_record(self, api_call: Dict) -> Optional[CallRecord]:
         """
         Parse API call data into CallRecord object.
@@ -983,16 +1584,19 @@ class RdioScannerClient:
         """
         try:
             # Extract required fields with fallbacks
-            call_id = api_call.get('id') or api_call.get('call_id') or str(uuid.uuid4())
+            call_id = _first_field(api_call, CALL_FIELD_ALIASES['call_id']) or str(uuid.uuid4())
             
             # Parse timestamp - try multiple formats
-            timestamp_raw = api_call.get('timestamp') or api_call.get('time') or api_call.get('datetime')
+            timestamp_raw = _first_field(api_call, CALL_FIELD_ALIASES['timestamp'])
             if isinstance(timestamp_raw, (int, float)):
                 timestamp = datetime.fromtimestamp(timestamp_raw, tz=timezone.utc)
             elif isinstance(timestamp_raw, str):
                 # Try to parse ISO format timestamp
                 try:
-                    timestamp = datetime.fromisoformat(timestamp_raw.replace('Z', '+00:00'))
+                    if ISOFORMAT_ACCEPTS_Z or not timestamp_raw.endswith('Z'):
+                        timestamp = datetime.fromisoformat(timestamp_raw)
+                    else:
+                        timestamp = datetime.fromisoformat(timestamp_raw[:-1] + '+00:00')
                 except ValueError:
                     # Fallback to current time if parsing fails
                     timestamp = datetime.now(timezone.utc)
@@ -1005,20 +1609,20 @@ class RdioScannerClient:
             duration = float(api_call.get('duration', 0)) if api_call.get('duration') else 0.0
             
             # Handle talkgroup - can be string or integer
-            talkgroup = api_call.get('talkgroup') or api_call.get('tg')
+            talkgroup = _first_field(api_call, CALL_FIELD_ALIASES['talkgroup'])
             if talkgroup is not None:
                 talkgroup = str(talkgroup)
             
             # Handle source - can be string or integer
-            source = api_call.get('source') or api_call.get('src')
+            source = _first_field(api_call, CALL_FIELD_ALIASES['source'])
             if source is not None:
                 source = str(source)
             
             # Extract audio URL
-            audio_url = (api_call.get('audio_url') or 
-                        api_call.get('audioUrl') or 
-                        api_call.get('audio') or 
-                        api_call.get('file'))
+            audio_url = _first_field(api_call, CALL_FIELD_ALIASES['audio_url'])
+            if isinstance(audio_url, str) and audio_url and not audio_url.startswith(('http://', 'https://')):
+                # Relative path, served from the scanner's own domain
+                audio_url = self.base_url + audio_url.lstrip('/')
             
             # Handle units list
             units = api_call.get('units', [])
@@ -1037,9 +1641,9 @@ class RdioScannerClient:
                 duration=duration,
                 audio_url=audio_url,
                 audio_file_path=None,  # Will be set when audio is downloaded
-                system_name=api_call.get('system') or api_call.get('system_name'),
-                department=api_call.get('department') or api_call.get('agency'),
-                call_type=api_call.get('type') or api_call.get('call_type'),
+                system_name=_first_field(api_call, CALL_FIELD_ALIASES['system_name']),
+                department=_first_field(api_call, CALL_FIELD_ALIASES['department']),
+                call_type=_first_field(api_call, CALL_FIELD_ALIASES['call_type']),
                 units=units,
                 metadata=api_call,  # Store full API response as metadata
                 processed=False
@@ -1102,7 +1706,9 @@ class SystemMonitor:
         self.start_time = datetime.now(timezone.utc)
         self.call_count = 0
         self.error_count = 0
-        self.processing_times = []
+        # Bounded so the oldest processing time drops out as a new one arrives
+        self.processing_times = deque(maxlen=1000)
+        self.processing_time_total = 0.0  # Running sum of processing_times
         
         # Monitoring lock for thread safety
         self.lock = threading.Lock()
@@ -1118,11 +1724,11 @@ class SystemMonitor:
         """
         with self.lock:
             self.call_count += 1
+            # Keep the running sum in step with the sample evicted by append
+            if len(self.processing_times) == self.processing_times.maxlen:
+                self.processing_time_total -= self.processing_times[0]
             self.processing_times.append(processing_time)
-            
-            # Keep only recent processing times (last 1000)
-            if len(self.processing_times) > 1000:
-                self.processing_times = self.processing_times[-1000:]
+            self.processing_time_total += processing_time
     
     def record_error(self):
         """Record that an error occurred."""
@@ -1139,7 +1745,7 @@ class SystemMonitor:
         with self.lock:
             uptime = datetime.now(timezone.utc) - self.start_time
             avg_processing_time = (
-                sum(self.processing_times) / len(self.processing_times)
+                self.processing_time_total / len(self.processing_times)
                 if self.processing_times else 0.0
             )
             
@@ -1167,7 +1773,6 @@ class SystemMonitor:
             Dict[str, Any]: Disk space information
         """
         try:
-            import shutil
             total, used, free = shutil.disk_usage(path)
             
             used_percent = (used / total) * 100
@@ -1281,6 +1886,10 @@ class RdioScannerMonitor:
     database management, audio processing, API communication, and monitoring.
     """
     
+    # Resources released by _shutdown; None until they have been created
+    exit_stack: Optional[contextlib.ExitStack] = None
+    log_listener: Optional["logging.handlers.QueueListener"] = None
+    
     def __init__(self, config_file: str):
         """
         Initialize the Rdio Scanner Monitor application.
@@ -1293,25 +1902,61 @@ class RdioScannerMonitor:
         self.running = False
         self.shutdown_event = threading.Event()
         
-        # Initialize components
-        self.db_manager = DatabaseManager(self.config)
-        self.audio_processor = AudioProcessor(self.config)
-        self.scanner_client = RdioScannerClient(self.config)
-        self.system_monitor = SystemMonitor(self.config)
+        # Guards _shutdown so teardown runs exactly once
+        self.shutdown_lock = threading.Lock()
+        self.shutdown_complete = False
+        
+        # Initialize components, registering each closable resource as it is
+        # built; if a later component fails, the earlier ones are released.
+        # Callbacks run in reverse order, so in-flight audio work finishes
+        # before the sessions and database connections it uses are closed.
+        with contextlib.ExitStack() as stack:
+            self.db_manager = DatabaseManager(self.config)
+            stack.callback(self.db_manager.close)
+            
+            self.audio_processor = AudioProcessor(self.config)
+            stack.callback(self.audio_processor.session.close)
+            
+            self.scanner_client = RdioScannerClient(self.config)
+            stack.callback(self.scanner_client.session.close)
+            
+            self.system_monitor = SystemMonitor(self.config)
+            
+            # Worker pool for downloading and processing call audio concurrently
+            self.audio_executor = ThreadPoolExecutor(
+                max_workers=self.audio_processor.download_workers,
+                thread_name_prefix='audio'
+            )
+            stack.callback(self.audio_executor.shutdown, wait=True)
+            
+            self.exit_stack = stack.pop_all()
         
         # Flask app for health endpoint
         self.app = None
         
-        # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        # Setup signal handlers for graceful shutdown; they only set the
+        # shutdown event, which wakes the main loop's wait immediately
+        for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP):
+            signal.signal(signum, self._signal_handler)
         
         # Configuration parameters
         self.poll_interval = self.config.getint('rdio_scanner', 'poll_interval')
+        self.max_calls_per_request = self.config.getint('rdio_scanner', 'max_calls_per_request')
+        self.retention_days = self.config.getint('audio', 'retention_days')
+        
+        # Optional scheduler tuning for the polling thread
+        cpu_affinity = self.config.get('performance', 'cpu_affinity', fallback='')
+        self.cpu_affinity = {int(cpu) for cpu in cpu_affinity.split(',') if cpu.strip()}
+        self.nice_increment = self.config.getint('performance', 'nice_increment', fallback=0)
         
         # Last poll timestamp tracking
         self.last_poll_time = None
         
+        # Periodic jobs as a heap of (deadline_ns, sequence, interval_ns, job); the
+        # sequence number breaks deadline ties so jobs are never compared
+        self.timers: List[Tuple[int, int, int, Callable[[], Any]]] = []
+        self.timer_sequence = itertools.count()
+        
         logger.info("Rdio Scanner Monitor initialized successfully")
     
     def _load_config(self) -> configparser.ConfigParser:
@@ -1321,14 +1966,14 @@ class RdioScannerMonitor:
         Returns:
             configparser.ConfigParser: Loaded configuration
         """
-        config = configparser.ConfigParser()
-        
-        if not os.path.exists(self.config_file):
+        try:
+            mtime_ns = os.stat(self.config_file).st_mtime_ns
+        except FileNotFoundError:
             logger.error(f"Configuration file not found: {self.config_file}")
             sys.exit(1)
         
         try:
-            config.read(self.config_file)
+            config = _read_config(self.config_file, mtime_ns)
             logger.info(f"Configuration loaded from: {self.config_file}")
             
             # Validate required sections and options
@@ -1346,7 +1991,7 @@ class RdioScannerMonitor:
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully."""
-        logger.info(f"Received signal {signum}, initiating graceful shutdown...")
+        logger.info(f"Received {signal.Signals(signum).name}, initiating graceful shutdown...")
         self.shutdown_event.set()
     
     def _setup_logging(self):
@@ -1369,27 +2014,68 @@ class RdioScannerMonitor:
         root_logger.handlers.clear()
         
         # File handler with rotation
-        from logging.handlers import RotatingFileHandler
+        from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
         file_handler = RotatingFileHandler(
             log_file,
             maxBytes=max_log_size,
             backupCount=log_backup_count
         )
         file_formatter = logging.Formatter(
-            self.config.get('logging', 'log_format'),
+            self.config.get('logging', 'log_format', raw=True),
             datefmt=self.config.get('logging', 'date_format')
         )
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        handlers = [file_handler]
         
         # Console handler if enabled
         if console_logging:
             console_handler = logging.StreamHandler()
             console_handler.setFormatter(file_formatter)
-            root_logger.addHandler(console_handler)
+            handlers.append(console_handler)
+        
+        # Write records from a background thread so disk and console I/O
+        # never stalls the poll loop; callers only enqueue the record
+        self.log_listener = QueueListener(queue.SimpleQueue(), *handlers, respect_handler_level=True)
+        root_logger.addHandler(QueueHandler(self.log_listener.queue))
+        self.log_listener.start()
         
         logger.info("Logging configuration applied")
     
+    def _apply_scheduling_settings(self):
+        """
+        Apply the configured CPU affinity and niceness to the polling thread.
+        
+        Keeping the poll, parse and insert cycle on one core preserves cache
+        locality between polls. On Linux both settings apply to the calling
+        thread and are inherited by threads it starts later, so the worker
+        pools are started first and keep the default scheduling. Must be
+        called after the health server and log listener threads exist.
+        Failures are logged and otherwise ignored.
+        """
+        if not self.cpu_affinity and not self.nice_increment:
+            return
+        
+        # ThreadPoolExecutor starts workers lazily on submit; start them all
+        # now so they don't inherit the polling thread's settings
+        _prestart_workers(self.audio_executor, self.audio_processor.download_workers)
+        if self.db_manager.insert_executor:
+            _prestart_workers(self.db_manager.insert_executor, self.db_manager.insert_shards)
+        
+        if self.cpu_affinity:
+            try:
+                # pid 0 is the calling thread only
+                os.sched_setaffinity(0, self.cpu_affinity)
+                logger.info(f"Polling thread pinned to CPUs {sorted(self.cpu_affinity)}")
+            except (AttributeError, OSError) as e:
+                logger.warning(f"Failed to set CPU affinity {sorted(self.cpu_affinity)}: {e}")
+        
+        if self.nice_increment:
+            try:
+                niceness = os.nice(self.nice_increment)
+                logger.info(f"Polling thread niceness set to {niceness}")
+            except (AttributeError, OSError) as e:
+                logger.warning(f"Failed to adjust niceness by {self.nice_increment}: {e}")
+    
     def start_health_server(self):
         """Start HTTP health check server."""
         try:
@@ -1449,43 +2135,51 @@ class RdioScannerMonitor:
     def poll_and_process_calls(self):
         """Poll for new calls and process them."""
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # Fetch calls from API
             calls_data = self.scanner_client.fetch_calls(
                 since=self.last_poll_time,
-                limit=self.config.getint('rdio_scanner', 'max_calls_per_request')
+                limit=self.max_calls_per_request
             )
             
             if not calls_data:
                 logger.debug("No new calls retrieved from API")
                 return
             
-            # Process each call
-            call_records = []
-            for call_data in calls_data:
-                call_record = self.scanner_client.parse_call_record(call_data)
-                if call_record:
-                    call_records.append(call_record)
+            # Parse the whole response in one pass
+            call_records = self.scanner_client.parse_call_records(calls_data)
             
             if not call_records:
                 logger.warning("No valid call records parsed from API response")
                 return
             
+            # Process audio for calls concurrently; downloads and ffmpeg runs
+            # release the GIL, so they overlap instead of running back to back.
+            # map submits every call up front, so the work is already under
+            # way while the batch insert below runs
+            audio_records = [record for record in call_records if record.audio_url]
+            results = self.audio_executor.map(self._process_call_audio, audio_records)
+            
             # Batch insert call records to database
             inserted_count = self.db_manager.insert_call_records_batch(call_records)
             logger.info(f"Inserted {inserted_count} call records into database")
             
-            # Process audio for each call
-            for call_record in call_records:
-                if call_record.audio_url:
-                    self._process_call_audio(call_record)
+            # Records are only updated once the insert has read them, then
+            # every successfully processed call is marked in one round trip
+            processed_ids = []
+            for record, processed_path in zip(audio_records, results):
+                if processed_path:
+                    record.audio_file_path = str(processed_path)
+                    record.processed = True
+                    processed_ids.append(record.call_id)
+            self.db_manager.mark_calls_processed(processed_ids)
             
             # Update last poll time
             self.last_poll_time = datetime.now(timezone.utc)
             
             # Record processing metrics
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             self.system_monitor.record_call_processed(processing_time)
             
             logger.info(f"Processed {len(call_records)} calls in {processing_time:.2f} seconds")
@@ -1494,12 +2188,19 @@ class RdioScannerMonitor:
             logger.error(f"Error during call polling and processing: {e}")
             self.system_monitor.record_error()
     
-    def _process_call_audio(self, call_record: CallRecord):
+    def _process_call_audio(self, call_record: CallRecord) -> Optional[Path]:
         """
         Process audio for a single call record.
         
+        Neither the record nor the database is updated here, since this runs
+        while the batch insert may still be reading the records; the caller
+        applies the result and marks processed calls in bulk.
+        
         Args:
             call_record: CallRecord to process audio for
+            
+        Returns:
+            Optional[Path]: Path to the processed audio, None on failure
         """
         try:
             # Download audio file
@@ -1510,25 +2211,21 @@ class RdioScannerMonitor:
             
             if not audio_path:
                 logger.warning(f"Failed to download audio for call {call_record.call_id}")
-                return
+                return None
             
             # Process audio file
             processed_path = self.audio_processor.process_audio(audio_path)
             
             if processed_path:
-                # Update call record with processed audio path
-                call_record.audio_file_path = str(processed_path)
-                call_record.processed = True
-                
-                # Update database record
-                self.db_manager.mark_call_processed(call_record.call_id)
-                
                 logger.debug(f"Successfully processed audio for call {call_record.call_id}")
+                return processed_path
             else:
                 logger.warning(f"Failed to process audio for call {call_record.call_id}")
+                return None
                 
         except Exception as e:
             logger.error(f"Error processing audio for call {call_record.call_id}: {e}")
+            return None
     
     def run_maintenance_tasks(self):
         """Run periodic maintenance tasks."""
@@ -1536,20 +2233,20 @@ class RdioScannerMonitor:
             logger.info("Running maintenance tasks...")
             
             # Cleanup old call records if retention is configured
-            retention_days = self.config.getint('audio', 'retention_days')
-            if retention_days > 0:
+            if self.retention_days > 0:
                 # Cleanup database records
-                deleted_records = self.db_manager.cleanup_old_records(retention_days)
+                deleted_records = self.db_manager.cleanup_old_records(self.retention_days)
                 logger.info(f"Cleaned up {deleted_records} old database records")
                 
-                # Cleanup audio files
-                deleted_files = self.audio_processor.cleanup_old_files()
+                # Cleanup audio files, collecting storage stats in the same pass
+                deleted_files, audio_stats = self.audio_processor.sweep_storage(delete_old=True)
                 logger.info(f"Cleaned up {deleted_files} old audio files")
+            else:
+                audio_stats = self.audio_processor.get_storage_stats()
             
             # Get and log system statistics
             stats = self.system_monitor.get_system_stats()
             db_stats = self.db_manager.get_call_statistics()
-            audio_stats = self.audio_processor.get_storage_stats()
             
             logger.info(f"System stats: {stats}")
             logger.info(f"Database stats: {db_stats}")
@@ -1568,14 +2265,18 @@ class RdioScannerMonitor:
         # Start health check server
         self.start_health_server()
         
+        # Pin and prioritize the polling thread if configured
+        self._apply_scheduling_settings()
+        
         # Test initial connections
         if not self.scanner_client.test_connection():
             logger.error("Failed to connect to Rdio Scanner API. Exiting.")
             return False
         
         # Schedule maintenance tasks
-        schedule.every(1).hours.do(self.run_maintenance_tasks)
-        schedule.every(self.system_monitor.health_check_interval).seconds.do(
+        self._schedule_every(3600, self.run_maintenance_tasks)
+        self._schedule_every(
+            self.system_monitor.health_check_interval,
             lambda: self.system_monitor.perform_health_check(
                 self.db_manager, 
                 self.scanner_client
@@ -1586,19 +2287,28 @@ class RdioScannerMonitor:
         logger.info("Rdio Scanner Monitor started successfully")
         
         try:
+            # Deadlines are integer nanoseconds on the monotonic clock, so
+            # wall-clock adjustments never shift the schedule
+            poll_interval_ns = int(self.poll_interval * NS_PER_SECOND)
+            next_poll = time.monotonic_ns()
             while self.running and not self.shutdown_event.is_set():
-                # Poll for new calls
-                self.poll_and_process_calls()
+                if time.monotonic_ns() >= next_poll:
+                    # Poll for new calls
+                    self.poll_and_process_calls()
+                    
+                    # Keep polls on a fixed cadence, so time spent polling doesn't
+                    # stretch the interval; a slow poll starts the next one at
+                    # once rather than bursting to catch up
+                    next_poll = max(next_poll + poll_interval_ns, time.monotonic_ns())
                 
                 # Run scheduled tasks
-                schedule.run_pending()
+                self._run_due_timers()
                 
-                # Wait for next poll interval or shutdown signal
-                if self.shutdown_event.wait(timeout=self.poll_interval):
+                # Sleep until the next poll or scheduled task, or a shutdown signal
+                wake_at = min(next_poll, self.timers[0][0]) if self.timers else next_poll
+                if self.shutdown_event.wait(timeout=(wake_at - time.monotonic_ns()) / NS_PER_SECOND):
                     break  # Shutdown signal received
                     
-        except KeyboardInterrupt:
-            logger.info("Received keyboard interrupt")
         except Exception as e:
             logger.error(f"Unexpected error in main loop: {e}")
         finally:
@@ -1606,36 +2316,95 @@ class RdioScannerMonitor:
         
         return True
     
-    def _shutdown(self):
-        """Cleanup and shutdown all components."""
-        logger.info("Shutting down Rdio Scanner Monitor...")
-        
-        self.running = False
+    def _schedule_every(self, interval: float, job: Callable[[], Any]):
+        """
+        Schedule a job to run repeatedly from the main loop.
         
-        # Close database connections
-        if hasattr(self, 'db_manager'):
-            self.db_manager.close()
+        Args:
+            interval: Seconds between runs; the first run is one interval from now
+            job: Callable to run
+        """
+        interval_ns = int(interval * NS_PER_SECOND)
+        heapq.heappush(self.timers, (time.monotonic_ns() + interval_ns, next(self.timer_sequence), interval_ns, job))
+    
+    def _run_due_timers(self):
+        """Run every scheduled job whose deadline has passed and reschedule it."""
+        now = time.monotonic_ns()
+        while self.timers and self.timers[0][0] <= now:
+            deadline, sequence, interval, job = heapq.heappop(self.timers)
+            try:
+                job()
+            except Exception as e:
+                logger.error(f"Scheduled task failed: {e}")
+            # Stay on the original cadence unless the job overran a whole interval
+            heapq.heappush(self.timers, (max(deadline + interval, time.monotonic_ns()), sequence, interval, job))
+    
+    def _shutdown(self):
+        """
+        Cleanup and shutdown all components.
         
-        logger.info("Rdio Scanner Monitor shutdown complete")
+        Safe to call more than once or from several threads; later calls wait
+        for the first teardown to finish and then return.
+        """
+        with self.shutdown_lock:
+            if self.shutdown_complete:
+                return
+            self.shutdown_complete = True
+            
+            logger.info("Shutting down Rdio Scanner Monitor...")
+            
+            self.running = False
+            
+            # Close everything registered at startup, newest first
+            if self.exit_stack is not None:
+                self.exit_stack.close()
+            
+            logger.info("Rdio Scanner Monitor shutdown complete")
+            
+            # Flush queued log records and write any later ones directly
+            if self.log_listener is not None:
+                self.log_listener.stop()
+                logging.getLogger().handlers[:] = self.log_listener.handlers
 
 
 def main():
     """Main entry point for the application."""
-    # Default configuration file path
-    config_file = os.environ.get('CONFIG_FILE', '/app/config/config.ini')
-    
-    # Parse command line arguments if needed
-    if len(sys.argv) > 1:
-        config_file = sys.argv[1]
+    # Parse command line arguments, defaulting the configuration file path
+    # from the environment
+    parser = argparse.ArgumentParser(description="Rdio Scanner Monitor")
+    parser.add_argument(
+        'config_file',
+        nargs='?',
+        default=os.environ.get('CONFIG_FILE', '/app/config/config.ini'),
+        help="Path to the configuration file (default: $CONFIG_FILE or /app/config/config.ini)"
+    )
+    args = parser.parse_args()
     
+    monitor = None
     try:
         # Create and run the monitor
-        monitor = RdioScannerMonitor(config_file)
+        monitor = RdioScannerMonitor(args.config_file)
         success = monitor.run()
-        sys.exit(0 if success else 1)
+        
+        # Release anything an early return from run() left open; after a
+        # normal run this is a no-op
+        monitor._shutdown()
+        
+        # Everything is closed, so flush output and exit without waiting on
+        # atexit handlers or finalizers racing leftover threads
+        logging.shutdown()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(0 if success else 1)
         
     except Exception as e:
         logger.error(f"Fatal error: {e}")
+        
+        # The log listener only exists once the monitor has been constructed,
+        # and _shutdown stops it after closing everything else
+        if monitor is not None:
+            monitor._shutdown()
+        logging.shutdown()
         sys.exit(1)
 
 
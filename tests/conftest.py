@@ -0,0 +1,36 @@
+"""Shared fixtures for the Rdio Scanner Monitor tests."""
+
+import configparser
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the top-level modules importable from the tests directory
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+
+@pytest.fixture
+def config() -> configparser.ConfigParser:
+    """Load the shipped configuration file."""
+    parser = configparser.ConfigParser()
+    parser.read(REPO_ROOT / 'config.ini')
+    return parser
+
+
+@pytest.fixture
+def db_manager(config):
+    """
+    DatabaseManager against the configured database (DATABASE_* environment
+    variables override config.ini); skipped when no server is reachable.
+    """
+    psycopg2 = pytest.importorskip('psycopg2')
+    import rdio_scanner
+    
+    try:
+        manager = rdio_scanner.DatabaseManager(config)
+    except psycopg2.Error as e:
+        pytest.skip(f"PostgreSQL not available: {e}")
+    yield manager
+    manager.close()
@@ -0,0 +1,57 @@
+"""Tests for AudioProcessor signal processing."""
+
+import pytest
+from pydub.generators import Sine
+
+from rdio_scanner import AudioProcessor
+
+
+@pytest.fixture
+def audio_processor(config, tmp_path):
+    """AudioProcessor storing files in a temporary directory."""
+    config.set('audio', 'storage_path', str(tmp_path))
+    return AudioProcessor(config)
+
+
+def _tone(duration_ms: int, volume_db: float):
+    """Mono 440 Hz tone at 8 kHz."""
+    return Sine(440, sample_rate=8000).to_audio_segment(duration=duration_ms, volume=volume_db).set_channels(1)
+
+
+def test_agc_compresses_loud_audio_above_threshold(audio_processor):
+    """A steady loud tone is reduced by (level - threshold) * (1 - 1/ratio)."""
+    audio = _tone(1000, -3.0)
+    
+    result = audio_processor._apply_agc(audio)
+    
+    expected_db = audio.dBFS - (audio.dBFS - -20.0) * (1 - 1 / 4.0)
+    assert result[200:].dBFS == pytest.approx(expected_db, abs=0.5)
+
+
+def test_agc_attack_reduces_gain_from_the_first_window(audio_processor):
+    """The onset of a loud passage is already attenuated by the attack stage."""
+    audio = _tone(1000, -3.0)
+    
+    result = audio_processor._apply_agc(audio)
+    
+    onset_reduction_db = audio[:5].dBFS - result[:5].dBFS
+    full_reduction_db = audio.dBFS - result[200:].dBFS
+    assert 0.5 * full_reduction_db < onset_reduction_db < full_reduction_db
+
+
+def test_agc_releases_after_loud_passage(audio_processor):
+    """Quiet audio after a loud passage returns to its input level."""
+    audio = _tone(1000, -3.0) + _tone(1000, -40.0)
+    
+    result = audio_processor._apply_agc(audio)
+    
+    assert result[1300:].dBFS == pytest.approx(audio[1300:].dBFS, abs=0.2)
+
+
+def test_agc_leaves_audio_below_threshold_unchanged(audio_processor):
+    """Audio that never crosses the threshold passes through untouched."""
+    audio = _tone(500, -30.0)
+    
+    result = audio_processor._apply_agc(audio)
+    
+    assert result.get_array_of_samples() == audio.get_array_of_samples()
@@ -0,0 +1,83 @@
+"""Tests for DatabaseManager batch insert paths."""
+
+import uuid
+from datetime import datetime, timezone
+
+from rdio_scanner import CallRecord
+
+
+def _make_record(call_id: str) -> CallRecord:
+    """Build a call record exercising NULLs, quoting and escapes."""
+    return CallRecord(
+        call_id=call_id,
+        timestamp=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        frequency=851.0125,
+        talkgroup='tg\t1',
+        source='src "1"',
+        duration=3.5,
+        audio_url='http://example.com/a.mp3',
+        audio_file_path=None,
+        system_name='County\\System',
+        department=None,
+        call_type='routine',
+        units=['unit,1', None, 'unit "2"', 'back\\slash', ''],
+        metadata={'text': 'line\nbreak', 'nested': [1, None, 'x']},
+        processed=False,
+    )
+
+
+def _fetch_call(db_manager, call_id: str) -> dict:
+    """Fetch the stored columns of a call that both insert paths write."""
+    conn = db_manager.get_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT timestamp, frequency, talkgroup, source, duration, audio_url,
+                       audio_file_path, system_name, department, call_type, units,
+                       metadata, processed
+                FROM calls WHERE call_id = %s
+                """,
+                (call_id,)
+            )
+            columns = [column.name for column in cursor.description]
+            row = cursor.fetchone()
+        conn.rollback()
+    finally:
+        db_manager.return_connection(conn)
+    assert row is not None, f"call {call_id} was not stored"
+    return dict(zip(columns, row))
+
+
+def _delete_calls(db_manager, call_ids):
+    """Remove test rows."""
+    conn = db_manager.get_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("DELETE FROM calls WHERE call_id = ANY(%s)", (list(call_ids),))
+        conn.commit()
+    finally:
+        db_manager.return_connection(conn)
+
+
+def test_values_and_copy_paths_store_identical_rows(db_manager):
+    """The same record written by the VALUES and COPY paths reads back the same."""
+    suffix = uuid.uuid4().hex
+    values_id, copy_id = f"test-values-{suffix}", f"test-copy-{suffix}"
+    
+    try:
+        # A batch below the threshold takes the VALUES path...
+        db_manager.copy_min_batch_size = 1000
+        assert db_manager.insert_call_records_batch([_make_record(values_id)]) == 1
+        
+        # ...and one at or above it takes the COPY path
+        db_manager.copy_min_batch_size = 1
+        assert db_manager.insert_call_records_batch([_make_record(copy_id)]) == 1
+        
+        values_row = _fetch_call(db_manager, values_id)
+        copy_row = _fetch_call(db_manager, copy_id)
+        
+        assert copy_row == values_row
+        assert values_row['units'] == ['unit,1', None, 'unit "2"', 'back\\slash', '']
+    finally:
+        _delete_calls(db_manager, [values_id, copy_id])